@@ -1,11 +1,22 @@
 """Boxing Schedule scraper.
 
 Pipeline:
-    fetch_events()         -> dict          (raw API response)
-    parse_events()         -> list[Event]   (typed, timezone-aware)
+    gather_sources()       -> dict          (Events per source adapter, concurrent)
+    resolve_fighters()     -> list[Event]   (canonical fighter names, per batch)
+    merge_sources()        -> list[Event]   (cross-source dedup, per-field provenance)
+    fetch_languages()      -> dict          (raw API response per extra language)
+    parse_locale_strings() -> LocaleStrings (translated strings, other languages)
     filter_recent()        -> list[Event]   (drop events older than cutoff)
-    build_calendar()       -> Calendar      (iCal object, RFC 5545)
-    write_ics()            -> bytes         (serialise + persist)
+    render_events()        -> list[RenderedEvent]  (display fields, computed once)
+    detect_changes()       -> ChangeSet     (diff vs last run; assigns SEQUENCE)
+    write_outputs()        -> dict          (ICS + JSON Feed + CSV + RSS, concurrently)
+    validate_ics()         -> list[str]     (streaming RFC 5545 check; gates publish)
+
+write_localized() renders and writes the other languages' feeds.
+build_calendar()/write_ics() remain for callers that only want the iCal feed.
+
+Every stage records counters and timings into `metrics`, which main() dumps
+to a Prometheus textfile at the end of the run (success or not).
 
 Data source: ringmagazine.com's public schedule API.  No browser, no HTML
 parsing -- the API returns the same structured records that power the website.
@@ -13,14 +24,31 @@ parsing -- the API returns the same structured records that power the website.
 
 from __future__ import annotations
 
+import csv
+import hashlib
+import http.client
+import io
 import json
 import logging
+import os
+import re
 import sys
+import tempfile
+import threading
+import time
+import unicodedata
 import urllib.error
 import urllib.request
-from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, replace
+from datetime import UTC, date, datetime, timedelta
+from email.utils import format_datetime
 from pathlib import Path
+from typing import Any, BinaryIO
+from xml.sax.saxutils import escape as xml_escape
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from icalendar import Calendar  # type: ignore[import-untyped]
@@ -30,11 +58,19 @@ from icalendar import Event as IcalEvent
 # Configuration
 # ---------------------------------------------------------------------------
 
-EVENTS_API = (
+EVENTS_API_TEMPLATE = (
     "https://www.ringmagazine.com/api/cached/v1/content/search/events/upcoming"
-    "?limit=50&language=en"
+    "?limit=50&language={lang}"
 )
+EVENTS_API = EVENTS_API_TEMPLATE.format(lang="en")
+# Feed languages.  The first is the primary feed (OUTPUT_FILES as named);
+# each other language gets its own set of files, e.g. boxing_schedule.es.ics.
+LANGUAGES: tuple[str, ...] = ("en",)
 HTTP_TIMEOUT_SECONDS = 30
+# Hand-maintained cards in the API's JSON shape, for events the API omits.
+MANUAL_EVENTS_FILE = Path("manual_events.json")
+# Learned name variant -> canonical fighter name, carried between runs.
+FIGHTER_ALIASES_FILE = Path("fighter_aliases.json")
 USER_AGENT = (
     "Mozilla/5.0 (compatible; boxing-schedule/3.0; "
     "+https://github.com/mhmdmstf/boxing-schedule)"
@@ -42,11 +78,222 @@ USER_AGENT = (
 EVENT_DURATION = timedelta(hours=4)
 PAST_EVENT_CUTOFF = timedelta(days=7)
 OUTPUT_FILE = Path("boxing_schedule.ics")
+JSON_FEED_FILE = Path("boxing_schedule.json")
+CSV_FILE = Path("boxing_schedule.csv")
+RSS_FILE = Path("boxing_schedule.xml")
+OUTPUT_FILES: dict[str, Path] = {
+    "ics": OUTPUT_FILE,
+    "json": JSON_FEED_FILE,
+    "csv": CSV_FILE,
+    "rss": RSS_FILE,
+}
+METRICS_FILE = Path("boxing_schedule.prom")
+STATE_FILE = Path("boxing_schedule.state.json")
+CHANGELOG_FILE = Path("boxing_schedule.changes.json")
+# How long a card that vanished from the feed keeps its SEQUENCE in the state
+# file, so a transient API omission doesn't reset it when the card returns.
+STATE_RETENTION = timedelta(days=30)
 CALENDAR_NAME = "Boxing Schedule"
 CALENDAR_PRODID = "-//Boxing Schedule//github-action//"
+ICS_MAX_LINE_OCTETS = 75  # RFC 5545 section 3.1, excluding the CRLF
+SCHEDULE_URL = "https://ringmagazine.com/en/schedule/fights"
 
 log = logging.getLogger("boxing")
 
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+#
+# Counters, gauges and histograms are kept in plain dicts keyed by
+# (name, labels) and rendered once per run in the Prometheus text exposition
+# format, for node_exporter's textfile collector.  Recording is a dict update
+# under a lock, so it stays on unconditionally.
+
+_DURATION_BUCKETS: tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# name -> (type, help).  Every metric recorded must be declared here.
+_METRIC_HELP: dict[str, tuple[str, str]] = {
+    "boxing_stage_duration_seconds": (
+        "histogram", "Wall time spent in each pipeline stage."),
+    "boxing_payload_bytes": (
+        "gauge", "Bytes of raw API response received, summed over languages."),
+    "boxing_api_records": (
+        "gauge", "Records present in the parsed payloads, summed over sources."),
+    "boxing_events": (
+        "gauge", "Events surviving each pipeline stage."),
+    "boxing_source_events": (
+        "gauge", "Events supplied by each source adapter."),
+    "boxing_fighter_resolutions_total": (
+        "counter", "Fighter names resolved, by how (alias, match or new)."),
+    "boxing_source_failures_total": (
+        "counter", "Source adapters that failed or timed out, by source and reason."),
+    "boxing_events_dropped_total": (
+        "counter", "Events dropped, by stage and reason."),
+    "boxing_timezone_fallbacks_total": (
+        "counter", "Timezone lookups that fell back to America/New_York."),
+    "boxing_output_bytes": (
+        "gauge", "Size of each written output file."),
+    "boxing_event_changes": (
+        "gauge", "Events by change kind relative to the previous run."),
+    "boxing_validation_errors": (
+        "gauge", "Problems found by validate_ics() in the written feed."),
+    "boxing_last_run_success": (
+        "gauge", "1 if the last run wrote a feed, 0 otherwise."),
+    "boxing_last_run_timestamp_seconds": (
+        "gauge", "Unix time at which the last run finished."),
+}
+
+_Labels = tuple[tuple[str, str], ...]
+
+
+class Metrics:
+    """In-process metric registry with Prometheus text rendering."""
+
+    def __init__(self, buckets: tuple[float, ...] = _DURATION_BUCKETS) -> None:
+        self._lock = threading.Lock()
+        self._buckets = buckets
+        self._values: dict[tuple[str, _Labels], float] = {}
+        # histogram series -> [count per bucket..., sum, count]
+        self._histograms: dict[tuple[str, _Labels], list[float]] = {}
+
+    @staticmethod
+    def _key(name: str, labels: dict[str, str]) -> tuple[str, _Labels]:
+        if name not in _METRIC_HELP:
+            raise KeyError(f"Undeclared metric {name!r}")
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set(self, name: str, value: float, **labels: str) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            self._values[key] = value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            series = self._histograms.get(key)
+            if series is None:
+                series = self._histograms[key] = [0.0] * (len(self._buckets) + 2)
+            for i, bound in enumerate(self._buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        """Observe the wall time of the `with` body, even if it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def get(self, name: str, **labels: str) -> float:
+        """Current counter/gauge value, or the observation count of a histogram."""
+        key = self._key(name, labels)
+        with self._lock:
+            if key in self._histograms:
+                return self._histograms[key][-1]
+            return self._values.get(key, 0.0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._histograms.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            values = sorted(self._values.items())
+            histograms = sorted((k, list(v)) for k, v in self._histograms.items())
+        lines: list[str] = []
+        for name, (kind, help_text) in _METRIC_HELP.items():
+            series = [(labels, v) for (n, labels), v in values if n == name]
+            buckets = [(labels, h) for (n, labels), h in histograms if n == name]
+            if not series and not buckets:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in series:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+            for labels, hist in buckets:
+                lines.extend(self._render_histogram(name, labels, hist))
+        return "\n".join(lines) + "\n"
+
+    def _render_histogram(self, name: str, labels: _Labels, hist: list[float]) -> list[str]:
+        lines = []
+        cumulative = 0.0
+        for bound, count in zip(self._buckets, hist, strict=False):
+            cumulative += count
+            le = labels + (("le", _format_value(bound)),)
+            lines.append(f"{name}_bucket{_format_labels(le)} {_format_value(cumulative)}")
+        inf = labels + (("le", "+Inf"),)
+        lines.append(f"{name}_bucket{_format_labels(inf)} {_format_value(hist[-1])}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(hist[-2])}")
+        lines.append(f"{name}_count{_format_labels(labels)} {_format_value(hist[-1])}")
+        return lines
+
+    def write(self, path: Path = METRICS_FILE) -> None:
+        _atomic_write(path, self.render().encode("utf-8"))
+
+
+def _format_labels(labels: _Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels) + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+@contextmanager
+def _staged(paths: Iterable[Path]) -> Iterator[dict[Path, Path]]:
+    """Map each of `paths` to a temp file in the same directory.  Leaving the
+    block normally renames every temp file over its target; an exception
+    discards them all and leaves the targets untouched."""
+    staged: dict[Path, Path] = {}
+    try:
+        for path in paths:
+            fd, name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+            os.close(fd)
+            staged[path] = Path(name)
+        yield staged
+        for path, tmp in staged.items():
+            os.chmod(tmp, 0o644)  # mkstemp creates 0600; collectors run as other users
+            os.replace(tmp, path)
+    except BaseException:
+        for tmp in staged.values():
+            tmp.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def _atomic_open(path: Path) -> Iterator[BinaryIO]:
+    """Stream into a temp file in the same directory and rename it over `path`
+    on success, so readers never see a half-written file."""
+    with _staged([path]) as staged, staged[path].open("wb") as fh:
+        yield fh
+
+
+def _atomic_write(path: Path, body: bytes) -> None:
+    with _atomic_open(path) as fh:
+        fh.write(body)
+
+
+metrics = Metrics()
+
 # ---------------------------------------------------------------------------
 # Timezone inference
 # ---------------------------------------------------------------------------
@@ -152,6 +399,7 @@ def infer_timezone(country: str | None, city: str | None) -> ZoneInfo:
             return _zoneinfo(tz_name)
     log.warning("Falling back to America/New_York for country=%r city=%r",
                 country, city)
+    metrics.inc("boxing_timezone_fallbacks_total")
     return ZoneInfo("America/New_York")
 
 
@@ -175,6 +423,7 @@ class Fight:
     is_main_event: bool
     weight_class: str | None = None
     rounds: int | None = None
+    id: str | None = None  # API fightId; keys translated strings
 
     @property
     def title(self) -> str:
@@ -193,6 +442,8 @@ class Event:
     country: str | None  # ISO-3166-1 alpha-2
     fights: tuple[Fight, ...]
     is_sold_out: bool
+    # field name -> source that supplied it; filled in by merge_sources()
+    provenance: dict[str, str] = field(default_factory=dict, compare=False)
 
     @property
     def main_event(self) -> Fight | None:
@@ -239,6 +490,7 @@ def parse_fight(raw: dict) -> Fight:
         is_main_event=bool(raw.get("isMainEvent")),
         weight_class=(raw.get("weightClass") or None),
         rounds=raw.get("noOfRounds"),
+        id=(raw.get("fightId") or None),
     )
 
 
@@ -248,12 +500,14 @@ def parse_event(raw: dict) -> Event | None:
     start_raw = raw.get("eventStart")
     if not start_raw:
         log.debug("Skipping event %s: no eventStart", raw.get("id"))
+        metrics.inc("boxing_events_dropped_total", stage="parse", reason="no_start")
         return None
     try:
         start_utc = _parse_iso_utc(start_raw)
     except ValueError:
         log.warning("Skipping event %s: unparsable eventStart %r",
                     raw.get("id"), start_raw)
+        metrics.inc("boxing_events_dropped_total", stage="parse", reason="bad_start")
         return None
 
     end_raw = raw.get("eventEnd")
@@ -264,6 +518,10 @@ def parse_event(raw: dict) -> Event | None:
         except ValueError:
             log.debug("Event %s has unparsable eventEnd %r", raw.get("id"),
                       end_raw)
+        if end_utc is not None and end_utc <= start_utc:
+            log.debug("Event %s has eventEnd %r not after eventStart; ignoring",
+                      raw.get("id"), end_raw)
+            end_utc = None
 
     fights = tuple(
         f for f in (parse_fight(rf) for rf in raw.get("fights") or [])
@@ -271,6 +529,7 @@ def parse_event(raw: dict) -> Event | None:
     )
     if not fights:
         log.debug("Skipping event %s: no named fights", raw.get("id"))
+        metrics.inc("boxing_events_dropped_total", stage="parse", reason="no_fights")
         return None
 
     location = raw.get("eventLocation") or {}
@@ -293,9 +552,63 @@ def parse_events(payload: dict) -> list[Event]:
         raise ValueError(f"Unexpected payload shape: data is {type(data).__name__}")
     parsed = [event for event in (parse_event(r) for r in data) if event]
     log.info("Parsed %d events from %d API records", len(parsed), len(data))
+    metrics.inc("boxing_api_records", len(data))
+    metrics.inc("boxing_events", len(parsed), stage="parse")
     return parsed
 
 
+@dataclass(frozen=True)
+class LocaleStrings:
+    """The language-dependent API strings of one non-primary language.
+
+    Everything else about an event (times, location codes, card order) is
+    language-independent and comes from the primary payload's Event.
+    """
+
+    lang: str
+    fighter_names: dict[str, tuple[str, str]]  # fightId -> (fighter A, fighter B)
+    weight_classes: dict[str, str]  # fightId -> weight class
+    venues: dict[str, str]  # event id -> venue name
+
+
+def parse_locale_strings(lang: str, payload: dict) -> LocaleStrings:
+    """Collect `lang`'s strings from its payload.  Anything of the wrong shape
+    is skipped with a warning: a secondary language is best-effort and must
+    not stop the primary feed."""
+    names: dict[str, tuple[str, str]] = {}
+    weight_classes: dict[str, str] = {}
+    venues: dict[str, str] = {}
+    data = (payload.get("data") or []) if isinstance(payload, dict) else payload
+    if not isinstance(data, list):
+        log.warning("Ignoring %s payload: data is %s", lang, type(data).__name__)
+        data = []
+    skipped = 0
+    for raw in data:
+        if not isinstance(raw, dict):
+            skipped += 1
+            continue
+        location = raw.get("eventLocation")
+        venue = location.get("venueName") if isinstance(location, dict) else None
+        if venue and raw.get("id"):
+            venues[str(raw["id"])] = venue
+        for rf in raw.get("fights") or []:
+            if not isinstance(rf, dict):
+                skipped += 1
+                continue
+            fight_id = rf.get("fightId")
+            if not fight_id:
+                continue
+            fight = parse_fight(rf)
+            if fight.fighter_a and fight.fighter_b:
+                names[fight_id] = (fight.fighter_a, fight.fighter_b)
+            if fight.weight_class:
+                weight_classes[fight_id] = fight.weight_class
+    if skipped:
+        log.warning("Skipped %d malformed records in %s payload", skipped, lang)
+    return LocaleStrings(lang=lang, fighter_names=names,
+                         weight_classes=weight_classes, venues=venues)
+
+
 # ---------------------------------------------------------------------------
 # Fetch
 # ---------------------------------------------------------------------------
@@ -314,10 +627,412 @@ def fetch_events(url: str = EVENTS_API) -> dict:
     except urllib.error.URLError as e:
         raise RuntimeError(f"Failed to fetch {url}: {e}") from e
     # API returns UTF-8 with a BOM in some responses; tolerate it.
+    metrics.inc("boxing_payload_bytes", len(body))
     payload: dict = json.loads(body.decode("utf-8-sig"))
     return payload
 
 
+def fetch_languages(languages: tuple[str, ...] = LANGUAGES,
+                    required: bool = True) -> dict[str, dict]:
+    """Fetch one payload per language concurrently.
+
+    If `required`, the first language's failure propagates; otherwise every
+    language is best-effort, and one that fails is simply left out.
+    """
+    with ThreadPoolExecutor(max_workers=max(len(languages), 1)) as pool:
+        futures = {
+            lang: pool.submit(fetch_events, EVENTS_API_TEMPLATE.format(lang=lang))
+            for lang in languages
+        }
+        payloads: dict[str, dict] = {}
+        for lang, future in futures.items():
+            try:
+                payloads[lang] = future.result()
+            except (RuntimeError, ValueError, OSError, http.client.HTTPException) as e:
+                # OSError covers read timeouts urllib doesn't wrap in URLError
+                if required and lang == languages[0]:
+                    raise
+                log.warning("Skipping language %s: %s", lang, e)
+    return payloads
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+#
+# A source adapter is a name plus a zero-argument loader returning parsed
+# Events.  gather_sources() runs every adapter on its own thread with its own
+# deadline; merge_sources() then folds the batches together in priority
+# order through a dict keyed on (normalized main-event pair, date), so each
+# event costs a few hash lookups instead of a comparison with every other.
+
+
+@dataclass(frozen=True)
+class Source:
+    name: str
+    load: Callable[[], list[Event]]
+    timeout: float = HTTP_TIMEOUT_SECONDS
+    required: bool = False  # failure aborts the run instead of being skipped
+
+
+def _load_ring_magazine() -> list[Event]:
+    return parse_events(fetch_events(EVENTS_API_TEMPLATE.format(lang=LANGUAGES[0])))
+
+
+def _load_manual_events(path: Path = MANUAL_EVENTS_FILE) -> list[Event]:
+    """Hand-written cards.  Ids get a "manual-" prefix so a card copied from
+    the API can't collide with the API's own; a card without an "id" gets one
+    derived from its main event and date, so its UID is stable across runs."""
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return []
+    if not isinstance(payload, dict):
+        raise ValueError(f"{path}: expected a JSON object with a \"data\" list")
+    return [replace(ev, id=f"manual-{ev.id}" if ev.id else _manual_event_id(ev))
+            for ev in parse_events(payload)]
+
+
+def _manual_event_id(event: Event) -> str:
+    fighters, day = _merge_key(event, event.start_utc.date())
+    digest = hashlib.sha256(f"{sorted(fighters)}|{day}".encode()).hexdigest()
+    return f"manual-{digest[:12]}"
+
+
+# In priority order: earlier sources win field conflicts in merge_sources().
+SOURCES: tuple[Source, ...] = (
+    Source("ringmagazine", _load_ring_magazine, HTTP_TIMEOUT_SECONDS + 5, required=True),
+    Source("manual", _load_manual_events, timeout=5),
+)
+
+
+def gather_sources(sources: tuple[Source, ...] = SOURCES) -> dict[str, list[Event]]:
+    """Run every adapter concurrently.  Returns Events per source name, in
+    the order given; optional sources that fail or time out are left out.
+
+    A timed-out loader can't be interrupted; its thread is abandoned and
+    finishes (or hits its own I/O timeout) in the background.
+    """
+    pool = ThreadPoolExecutor(max_workers=max(len(sources), 1))
+    started = time.monotonic()
+    try:
+        futures = [(src, pool.submit(src.load)) for src in sources]
+        batches: dict[str, list[Event]] = {}
+        for src, future in futures:
+            remaining = max(0.0, started + src.timeout - time.monotonic())
+            try:
+                batches[src.name] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                metrics.inc("boxing_source_failures_total", source=src.name, reason="timeout")
+                if src.required:
+                    raise RuntimeError(
+                        f"Source {src.name} timed out after {src.timeout}s") from None
+                log.warning("Skipping source %s: timed out after %ss", src.name, src.timeout)
+                continue
+            except Exception as e:  # an optional source must never stop the run
+                metrics.inc("boxing_source_failures_total", source=src.name, reason="error")
+                if src.required:
+                    raise
+                log.warning("Skipping source %s: %s", src.name, e)
+                continue
+            metrics.set("boxing_source_events", len(batches[src.name]), source=src.name)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return batches
+
+
+_QUOTED_NICKNAME = re.compile(r'"[^"]*"|\u201c[^\u201d]*\u201d|\([^)]*\)')
+
+
+def _normalize_name(name: str) -> str:
+    """Case-, accent- and punctuation-insensitive form of a fighter name,
+    without any double-quoted or parenthesized nickname."""
+    name = _QUOTED_NICKNAME.sub(" ", name)
+    decomposed = unicodedata.normalize("NFKD", name.casefold())
+    kept = "".join(ch if ch.isalnum() else " " for ch in decomposed
+                   if not unicodedata.combining(ch))
+    return " ".join(kept.split())
+
+
+def _merge_key(event: Event, day: date) -> tuple[frozenset[str], date]:
+    main = event.main_event
+    assert main is not None  # parse_event already rejected empty cards
+    return frozenset((_normalize_name(main.fighter_a), _normalize_name(main.fighter_b))), day
+
+
+_MERGED_FIELDS = tuple(f.name for f in fields(Event) if f.name not in ("id", "provenance"))
+
+
+def merge_sources(batches: dict[str, list[Event]]) -> list[Event]:
+    """Deduplicate events across sources.
+
+    Events match when their main events have the same fighters (after
+    normalization) on the same UTC date, give or take a day to absorb
+    sources that disagree on the start time.  The first source to supply an
+    event owns its id; every other field comes from the first source that
+    has a value for it, and `provenance` records which one that was.  The
+    end time is only taken along with the start it belongs to, so a source
+    that disagrees on the start can't put the end before it.
+    """
+    merged: list[Event] = []
+    index: dict[tuple[frozenset[str], date], int] = {}
+    for source, events in batches.items():
+        for ev in events:
+            day = ev.start_utc.date()
+            slot = next((index[key] for key in (
+                _merge_key(ev, day),
+                _merge_key(ev, day - timedelta(days=1)),
+                _merge_key(ev, day + timedelta(days=1)),
+            ) if key in index), None)
+            if slot is None:
+                index[_merge_key(ev, day)] = len(merged)
+                merged.append(replace(ev, provenance=dict.fromkeys(_MERGED_FIELDS, source)))
+                continue
+            base = merged[slot]
+            updates: dict[str, Any] = {}
+            provenance = dict(base.provenance)
+            for name in _MERGED_FIELDS:
+                if name == "end_utc" and ev.start_utc != base.start_utc:
+                    continue
+                if getattr(base, name) in (None, ()) and getattr(ev, name) not in (None, ()):
+                    updates[name] = getattr(ev, name)
+                    provenance[name] = source
+            if updates:
+                merged[slot] = replace(base, provenance=provenance, **updates)
+    metrics.set("boxing_events", len(merged), stage="merge")
+    return merged
+
+
+# ---------------------------------------------------------------------------
+# Fighter entity resolution
+# ---------------------------------------------------------------------------
+#
+# Sources spell the same fighter differently ("Oleksandr Usyk" / "Alexander
+# Usyk", "Saul 'Canelo' Alvarez").  FighterResolver maps every spelling to one
+# canonical name.  Candidates come from a blocking index -- a phonetic key of
+# the surname plus the surname's character trigrams -- so each lookup only
+# scores the handful of names sharing a block, never every known fighter.
+# Decisions are cached as aliases and persisted, so a name is only ever
+# matched once.
+
+# Curated variants the heuristics can't (or shouldn't) infer.  Keys are
+# _normalize_name() forms; values are canonical display names.
+_NAME_ALIASES: dict[str, str] = {
+    "alexander usyk": "Oleksandr Usyk",
+    "aleksandr usyk": "Oleksandr Usyk",
+    "saul alvarez": "Canelo Alvarez",
+    "saul canelo alvarez": "Canelo Alvarez",
+}
+
+# Spelling folds applied before keying: transliteration variants collapse to
+# one form (Oleksandr/Aleksandr -> olexandr, Usyk/Usik -> usik).
+_TRANSLIT_RULES: tuple[tuple[str, str], ...] = (
+    ("tch", "ch"), ("cks", "x"), ("ks", "x"), ("kh", "h"), ("ph", "f"),
+    ("th", "t"), ("ck", "k"), ("w", "v"), ("y", "i"), ("ii", "i"), ("ij", "i"),
+)
+_VOWELS = frozenset("aeiou")
+# Generational suffixes, as _normalize_name() leaves them ("Jr." -> "jr").
+_NAME_SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv"})
+# Trigram blocks that reach this size are too common to narrow anything
+# down; they stop growing and are skipped at lookup.
+_MAX_TRIGRAM_BLOCK = 64
+# Trigram Jaccard thresholds.  A surname needs less spelling overlap when it
+# also sounds the same.  The given-name bar keeps Oleksandr ~ Alexander
+# (0.44) but separates twins like Jermell / Jermall (0.25).
+_SURNAME_SIMILARITY = 0.5
+_SURNAME_SPELLING_SIMILARITY = 0.75
+_GIVEN_NAME_SIMILARITY = 0.4
+
+
+def _transliterate(token: str) -> str:
+    for old, new in _TRANSLIT_RULES:
+        token = token.replace(old, new)
+    return token
+
+
+def _phonetic_key(token: str) -> str:
+    """Consonant skeleton of a transliterated token; any leading vowel maps
+    to '*' so Oleksandr and Alexander share a key."""
+    if not token:
+        return ""
+    key = "*" if token[0] in _VOWELS else token[0]
+    for ch in token[1:]:
+        if ch not in _VOWELS and ch != key[-1]:
+            key += ch
+    return key
+
+
+def _trigrams(text: str, pad: bool = True) -> frozenset[str]:
+    """Character trigrams.  Padding lets short surnames (Abe, Wu) have some."""
+    if pad:
+        text = f" {text} "
+    return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+
+
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass(frozen=True)
+class _NameKey:
+    surname: str  # transliterated
+    given: str  # transliterated, space-joined
+    surname_sound: str
+    given_sound: str
+    surname_grams: frozenset[str]
+    given_grams: frozenset[str]
+    suffix: str = ""  # "jr", "sr", ... ; never the surname
+
+    @classmethod
+    def of(cls, normalized: str) -> _NameKey:
+        tokens = normalized.split()
+        suffix = ""
+        if len(tokens) > 1 and tokens[-1] in _NAME_SUFFIXES:
+            suffix = tokens.pop()
+        tokens = [_transliterate(t) for t in tokens]
+        surname = tokens[-1] if tokens else ""
+        given = " ".join(tokens[:-1])
+        return cls(
+            surname=surname,
+            given=given,
+            surname_sound=_phonetic_key(surname),
+            given_sound=_phonetic_key(given.replace(" ", "")),
+            surname_grams=_trigrams(surname),
+            given_grams=_trigrams(given, pad=False),
+            suffix=suffix,
+        )
+
+    def blocks(self) -> list[str]:
+        """Blocking keys: the surname's sound and each surname trigram, each
+        qualified by the start of the given name's sound to keep blocks small
+        (Oleksandr and Alexander both start '*lx')."""
+        given = self.given_sound[:3]
+        return [f"{self.surname_sound}|{given}"] + [
+            f"{gram}|{given}" for gram in sorted(self.surname_grams)]
+
+    def matches(self, other: _NameKey) -> bool:
+        # Jr and Sr are different people; a missing suffix matches either.
+        if self.suffix and other.suffix and self.suffix != other.suffix:
+            return False
+        sounds_same = self.surname_sound == other.surname_sound
+        threshold = _SURNAME_SIMILARITY if sounds_same else _SURNAME_SPELLING_SIMILARITY
+        if _jaccard(self.surname_grams, other.surname_grams) < threshold:
+            return False
+        if not self.given_grams or not other.given_grams:
+            return self.given == other.given  # mononyms, initials, very short names
+        return _jaccard(self.given_grams, other.given_grams) >= _GIVEN_NAME_SIMILARITY
+
+
+class FighterResolver:
+    """Maps fighter name variants to canonical names.  Thread-safe."""
+
+    def __init__(self, aliases: dict[str, str] | None = None) -> None:
+        self._lock = threading.Lock()
+        self._aliases: dict[str, str] = dict(_NAME_ALIASES)
+        self._aliases.update(aliases or {})
+        self._keys: dict[str, _NameKey] = {}  # canonical -> key
+        self._blocks: dict[str, list[str]] = {}  # blocking key -> canonicals
+        self._learned = 0
+        for canonical in set(self._aliases.values()):
+            self._index(canonical)
+
+    @property
+    def aliases(self) -> dict[str, str]:
+        with self._lock:
+            return dict(self._aliases)
+
+    @property
+    def learned(self) -> int:
+        """Aliases added since construction."""
+        return self._learned
+
+    def _index(self, canonical: str) -> None:
+        key = _NameKey.of(_normalize_name(canonical))
+        self._keys[canonical] = key
+        sound_block, *gram_blocks = key.blocks()
+        self._blocks.setdefault(sound_block, []).append(canonical)
+        for block in gram_blocks:
+            members = self._blocks.setdefault(block, [])
+            if len(members) < _MAX_TRIGRAM_BLOCK:
+                members.append(canonical)
+
+    def _candidates(self, key: _NameKey) -> list[str]:
+        """Names sharing the sound block, plus names sharing enough surname
+        trigram blocks to possibly pass the spelling threshold."""
+        sound_block, *gram_blocks = key.blocks()
+        found = dict.fromkeys(self._blocks.get(sound_block, ()))
+        hits: dict[str, int] = {}
+        for block in gram_blocks:
+            members = self._blocks.get(block, ())
+            if len(members) < _MAX_TRIGRAM_BLOCK:
+                for name in members:
+                    hits[name] = hits.get(name, 0) + 1
+        needed = _SURNAME_SPELLING_SIMILARITY * len(gram_blocks)
+        found.update((name, None) for name, n in hits.items() if n >= needed)
+        return list(found)
+
+    def resolve(self, name: str) -> str:
+        normalized = _normalize_name(name)
+        if not normalized:
+            return name
+        with self._lock:
+            canonical = self._aliases.get(normalized)
+            if canonical is not None:
+                metrics.inc("boxing_fighter_resolutions_total", result="alias")
+                return canonical
+            key = _NameKey.of(normalized)
+            for candidate in self._candidates(key):
+                if key.matches(self._keys[candidate]):
+                    canonical, result = candidate, "match"
+                    break
+            else:
+                canonical, result = name, "new"
+                self._index(canonical)
+            self._aliases[normalized] = canonical
+            self._learned += 1
+        metrics.inc("boxing_fighter_resolutions_total", result=result)
+        return canonical
+
+    @classmethod
+    def load(cls, path: Path = FIGHTER_ALIASES_FILE) -> FighterResolver:
+        try:
+            aliases = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            aliases = {}
+        except ValueError as e:
+            log.warning("Ignoring unreadable alias cache %s: %s", path, e)
+            aliases = {}
+        if not isinstance(aliases, dict):
+            log.warning("Ignoring alias cache %s: not a JSON object", path)
+            aliases = {}
+        # The file is meant to be hand-edited: keys may be written as display
+        # names ("Saul Alvarez"), and entries that aren't names are skipped.
+        valid: dict[str, str] = {}
+        for key, value in aliases.items():
+            normalized = _normalize_name(key)
+            if normalized and isinstance(value, str) and value.strip():
+                valid[normalized] = value
+            else:
+                log.warning("Ignoring alias %r -> %r in %s: not a non-empty name",
+                            key, value, path)
+        return cls(valid)
+
+    def save(self, path: Path = FIGHTER_ALIASES_FILE) -> None:
+        body = json.dumps(dict(sorted(self.aliases.items())), ensure_ascii=False, indent=1)
+        _atomic_write(path, (body + "\n").encode("utf-8"))
+
+
+def resolve_fighters(events: list[Event], resolver: FighterResolver) -> list[Event]:
+    """Replace every fighter name with its canonical form."""
+    def canonical(fight: Fight) -> Fight:
+        return replace(fight, fighter_a=resolver.resolve(fight.fighter_a),
+                       fighter_b=resolver.resolve(fight.fighter_b))
+
+    return [replace(ev, fights=tuple(canonical(f) for f in ev.fights)) for ev in events]
+
+
 # ---------------------------------------------------------------------------
 # Filtering
 # ---------------------------------------------------------------------------
@@ -340,6 +1055,8 @@ def filter_recent(
             dropped += 1
     if dropped:
         log.info("Filtered %d past events (older than %s)", dropped, cutoff.date())
+        metrics.inc("boxing_events_dropped_total", dropped, stage="filter", reason="past")
+    metrics.set("boxing_events", len(kept), stage="filter")
     return kept
 
 
@@ -348,42 +1065,176 @@ def filter_recent(
 # ---------------------------------------------------------------------------
 
 
-def _format_summary(event: Event) -> str:
-    main = event.main_event
-    assert main is not None  # parse_event already rejected empty cards
+# Fixed strings of the rendered feed, per language.  Languages without an
+# entry render with the English labels (API strings are still translated).
+_LABELS: dict[str, dict[str, str]] = {
+    "en": {
+        "more": "+{n} more",
+        "main_event": "MAIN EVENT",
+        "rounds": "{n} rounds",
+        "undercard": "Undercard",
+        "venue": "Venue",
+        "local_start": "Local start",
+        "start_format": "%a %d %b %Y, %H:%M %Z",
+        "sold_out": "Status: SOLD OUT",
+    },
+    "es": {
+        "more": "+{n} más",
+        "main_event": "COMBATE ESTELAR",
+        "rounds": "{n} asaltos",
+        "undercard": "Cartelera",
+        "venue": "Sede",
+        "local_start": "Inicio (hora local)",
+        "start_format": "%d/%m/%Y, %H:%M %Z",
+        "sold_out": "Estado: ENTRADAS AGOTADAS",
+    },
+    "fr": {
+        "more": "+{n} autres",
+        "main_event": "COMBAT PRINCIPAL",
+        "rounds": "{n} reprises",
+        "undercard": "Sous-cartes",
+        "venue": "Lieu",
+        "local_start": "Début (heure locale)",
+        "start_format": "%d/%m/%Y, %H:%M %Z",
+        "sold_out": "Statut : COMPLET",
+    },
+    "de": {
+        "more": "+{n} weitere",
+        "main_event": "HAUPTKAMPF",
+        "rounds": "{n} Runden",
+        "undercard": "Vorprogramm",
+        "venue": "Austragungsort",
+        "local_start": "Beginn (Ortszeit)",
+        "start_format": "%d.%m.%Y, %H:%M %Z",
+        "sold_out": "Status: AUSVERKAUFT",
+    },
+}
+
+
+@dataclass(frozen=True)
+class RenderedEvent:
+    """An Event plus every display field the writers need, computed once."""
+
+    event: Event
+    uid: str
+    summary: str
+    description: str
+    local_start: datetime
+    local_end: datetime
+    main: Fight
+    undercards: tuple[Fight, ...]
+    location: str | None  # None when the venue is unknown
+    sequence: int = 0
+
+
+def _format_summary(main: Fight, undercards: tuple[Fight, ...],
+                    labels: dict[str, str]) -> str:
     summary = f"\U0001f94a {main.title.upper()}"
-    n_uc = len(event.undercards)
-    if n_uc:
-        summary += f" (+{n_uc} more)"
+    if undercards:
+        summary += f" ({labels['more'].format(n=len(undercards))})"
     return summary
 
 
-def _format_description(event: Event) -> str:
-    main = event.main_event
-    assert main is not None
-    lines = [f"MAIN EVENT: {main.title.upper()}"]
+def _format_description(event: Event, main: Fight, undercards: tuple[Fight, ...],
+                        location: str | None, local_start: datetime,
+                        labels: dict[str, str]) -> str:
+    lines = [f"{labels['main_event']}: {main.title.upper()}"]
     if main.weight_class:
         lines.append(f"  {main.weight_class}"
-                     + (f", {main.rounds} rounds" if main.rounds else ""))
-    if event.undercards:
+                     + (f", {labels['rounds'].format(n=main.rounds)}" if main.rounds else ""))
+    if undercards:
         lines.append("")
-        lines.append("Undercard:")
-        for uc in event.undercards:
+        lines.append(f"{labels['undercard']}:")
+        for uc in undercards:
             line = f"  - {uc.title}"
             if uc.weight_class:
                 line += f"  ({uc.weight_class})"
             lines.append(line)
     lines.append("")
-    if event.venue:
-        lines.append(f"Venue: {event.location_str}")
-    local = event.local_start
-    lines.append(f"Local start: {local:%a %d %b %Y, %H:%M %Z}")
+    if location:
+        lines.append(f"{labels['venue']}: {location}")
+    lines.append(f"{labels['local_start']}: {local_start.strftime(labels['start_format'])}")
     if event.is_sold_out:
-        lines.append("Status: SOLD OUT")
+        lines.append(labels["sold_out"])
     return "\n".join(lines)
 
 
-def build_calendar(events: list[Event], now_utc: datetime | None = None) -> Calendar:
+def _localize_fight(fight: Fight, strings: LocaleStrings) -> Fight:
+    if fight.id is None:
+        return fight
+    fighter_a, fighter_b = strings.fighter_names.get(
+        fight.id, (fight.fighter_a, fight.fighter_b))
+    return replace(
+        fight,
+        fighter_a=fighter_a,
+        fighter_b=fighter_b,
+        weight_class=strings.weight_classes.get(fight.id, fight.weight_class),
+    )
+
+
+def localize_events(events: Sequence[Event]) -> list[tuple[datetime, datetime]]:
+    """(local start, local end) for each event, in input order.
+
+    infer_timezone() runs once per distinct venue rather than once per
+    timestamp, so a large archive pays for zone lookup (and its fallback
+    warning) a handful of times.  The conversion itself stays astimezone:
+    CPython's zoneinfo already caches each zone's transition table and bisects
+    it in C, which measured several times faster than a Python-level table and
+    keeps results, fold included, identical.  A missing end is
+    start + EVENT_DURATION, as in the feed.
+    """
+    zones: dict[tuple[str | None, str | None], ZoneInfo] = {}
+    result = []
+    for ev in events:
+        venue = (ev.country, ev.city)
+        tz = zones.get(venue)
+        if tz is None:
+            tz = zones[venue] = infer_timezone(ev.country, ev.city)
+        start = ev.start_utc.astimezone(tz)
+        end = ev.end_utc.astimezone(tz) if ev.end_utc else start + EVENT_DURATION
+        result.append((start, end))
+    return result
+
+
+def render_event(event: Event, lang: str = "en",
+                 strings: LocaleStrings | None = None,
+                 local: tuple[datetime, datetime] | None = None) -> RenderedEvent:
+    """Render `event` in `lang`.  `strings` supplies translated API strings;
+    without it the event's own (primary-language) strings are used.  `local`
+    is the precomputed (start, end) from localize_events()."""
+    main = event.main_event
+    assert main is not None  # parse_event already rejected empty cards
+    undercards = event.undercards
+    location = event.location_str if event.venue else None
+    if strings is not None:
+        main = _localize_fight(main, strings)
+        undercards = tuple(_localize_fight(f, strings) for f in undercards)
+        if event.id in strings.venues:
+            location = ", ".join(
+                p for p in (strings.venues[event.id], event.city, event.country) if p)
+    labels = _LABELS.get(lang, _LABELS["en"])
+    local_start, local_end = local or localize_events([event])[0]
+    return RenderedEvent(
+        event=event,
+        uid=f"boxing-{event.id}@ringmagazine.com",
+        summary=_format_summary(main, undercards, labels),
+        description=_format_description(event, main, undercards, location,
+                                        local_start, labels),
+        local_start=local_start,
+        local_end=local_end,
+        main=main,
+        undercards=undercards,
+        location=location,
+    )
+
+
+def render_events(events: list[Event], lang: str = "en",
+                  strings: LocaleStrings | None = None) -> list[RenderedEvent]:
+    return [render_event(ev, lang, strings, local)
+            for ev, local in zip(events, localize_events(events), strict=True)]
+
+
+def _calendar_from(rendered: list[RenderedEvent], stamp: datetime) -> Calendar:
     cal = Calendar()
     cal.add("prodid", CALENDAR_PRODID)
     cal.add("version", "2.0")
@@ -391,34 +1242,607 @@ def build_calendar(events: list[Event], now_utc: datetime | None = None) -> Cale
     cal.add("method", "PUBLISH")
     cal.add("x-wr-calname", CALENDAR_NAME)
 
-    stamp = now_utc or datetime.now(UTC)
-
-    for event in events:
+    for r in rendered:
         ical = IcalEvent()
-        ical.add("uid", f"boxing-{event.id}@ringmagazine.com")
-        ical.add("summary", _format_summary(event))
-        ical.add("description", _format_description(event))
+        ical.add("uid", r.uid)
+        ical.add("summary", r.summary)
+        ical.add("description", r.description)
         ical.add("dtstamp", stamp)
-        ical.add("sequence", 0)
+        ical.add("sequence", r.sequence)
         ical.add("status", "CONFIRMED")
-        dtstart = event.local_start
-        dtend = (event.end_utc.astimezone(event.timezone)
-                 if event.end_utc else dtstart + EVENT_DURATION)
-        ical.add("dtstart", dtstart)
-        ical.add("dtend", dtend)
-        if event.venue:
-            ical.add("location", event.location_str)
+        ical.add("dtstart", r.local_start)
+        ical.add("dtend", r.local_end)
+        if r.location:
+            ical.add("location", r.location)
         cal.add_component(ical)
 
     return cal
 
 
+def build_calendar(events: list[Event], now_utc: datetime | None = None) -> Calendar:
+    return _calendar_from(render_events(events), now_utc or datetime.now(UTC))
+
+
 def write_ics(calendar: Calendar, path: Path = OUTPUT_FILE) -> int:
     body = calendar.to_ical()
-    path.write_bytes(body)
+    _atomic_write(path, body)
+    metrics.set("boxing_output_bytes", len(body), format="ics", file=path.name)
     return len(body)
 
 
+# ---------------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------------
+#
+# Each run fingerprints every rendered event and compares against the state
+# file written by the previous run: one dict lookup per UID, so the diff is
+# linear in the size of the feed.  SEQUENCE is bumped only when the
+# fingerprint changes, which is what tells calendar clients to refresh a card.
+
+
+@dataclass(frozen=True)
+class EventState:
+    fingerprint: str
+    sequence: int
+    last_seen: datetime
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    """Result of diffing this run against the previous one, by UID."""
+
+    added: tuple[str, ...]
+    changed: tuple[str, ...]
+    removed: tuple[str, ...]
+    unchanged: tuple[str, ...]
+    rendered: list[RenderedEvent]  # input events with SEQUENCE assigned
+    state: dict[str, EventState]  # what to persist for the next run
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def fingerprint(r: RenderedEvent) -> str:
+    """Hash of everything a subscriber sees.  Excludes DTSTAMP and SEQUENCE."""
+    content = "\x1f".join((
+        r.summary,
+        r.description,
+        r.local_start.isoformat(),
+        str(r.local_start.tzinfo),
+        r.local_end.isoformat(),
+        r.location or "",
+    ))
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+
+def load_state(path: Path = STATE_FILE) -> dict[str, EventState]:
+    """Read the previous run's state.  A missing or unreadable file means
+    every event is treated as new."""
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        return {
+            uid: EventState(
+                fingerprint=entry["fingerprint"],
+                sequence=int(entry["sequence"]),
+                last_seen=datetime.fromisoformat(entry["last_seen"]),
+            )
+            for uid, entry in raw["events"].items()
+        }
+    except FileNotFoundError:
+        return {}
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        log.warning("Ignoring unreadable state file %s: %s", path, e)
+        return {}
+
+
+def detect_changes(
+    rendered: list[RenderedEvent],
+    previous: dict[str, EventState],
+    now_utc: datetime | None = None,
+    retention: timedelta = STATE_RETENTION,
+) -> ChangeSet:
+    """Classify `rendered` against `previous` as added/changed/unchanged (and
+    previous UIDs as removed), assigning each event its SEQUENCE."""
+    now = now_utc or datetime.now(UTC)
+    # Entries not refreshed by the last run belong to cards already gone then.
+    last_run = max((p.last_seen for p in previous.values()), default=now)
+    added: list[str] = []
+    changed: list[str] = []
+    unchanged: list[str] = []
+    state: dict[str, EventState] = {}
+    sequenced: list[RenderedEvent] = []
+
+    for r in rendered:
+        fp = fingerprint(r)
+        prev = previous.get(r.uid)
+        if prev is None:
+            sequence = 0
+            added.append(r.uid)
+        else:
+            sequence = prev.sequence + (0 if prev.fingerprint == fp else 1)
+            if prev.last_seen < last_run:
+                added.append(r.uid)  # returning after a gap
+            elif prev.fingerprint == fp:
+                unchanged.append(r.uid)
+            else:
+                changed.append(r.uid)
+        state[r.uid] = EventState(fingerprint=fp, sequence=sequence, last_seen=now)
+        sequenced.append(replace(r, sequence=sequence))
+
+    removed: list[str] = []
+    for uid, prev in previous.items():
+        if uid in state:
+            continue
+        if prev.last_seen == last_run:
+            removed.append(uid)
+        if now - prev.last_seen < retention:
+            state[uid] = prev
+
+    for kind, uids in (("added", added), ("changed", changed),
+                       ("removed", removed), ("unchanged", unchanged)):
+        metrics.set("boxing_event_changes", len(uids), kind=kind)
+    return ChangeSet(
+        added=tuple(added),
+        changed=tuple(changed),
+        removed=tuple(removed),
+        unchanged=tuple(unchanged),
+        rendered=sequenced,
+        state=state,
+    )
+
+
+def save_state(state: dict[str, EventState], path: Path = STATE_FILE) -> None:
+    body = {
+        "version": 1,
+        "events": {
+            uid: {
+                "fingerprint": s.fingerprint,
+                "sequence": s.sequence,
+                "last_seen": s.last_seen.isoformat(),
+            }
+            for uid, s in sorted(state.items())
+        },
+    }
+    _atomic_write(path, (json.dumps(body, indent=1) + "\n").encode("utf-8"))
+
+
+def write_changelog(changes: ChangeSet, path: Path = CHANGELOG_FILE,
+                    now_utc: datetime | None = None) -> None:
+    """Write the run's diff as a small JSON document, so downstream jobs can
+    act on what changed without diffing whole feeds."""
+    by_uid = {r.uid: r for r in changes.rendered}
+
+    def entry(uid: str) -> dict:
+        r = by_uid[uid]
+        return {
+            "uid": uid,
+            "sequence": r.sequence,
+            "summary": r.summary,
+            "start": r.local_start.isoformat(),
+        }
+
+    body = {
+        "generated": (now_utc or datetime.now(UTC)).isoformat(),
+        "added": [entry(uid) for uid in changes.added],
+        "changed": [entry(uid) for uid in changes.changed],
+        "removed": list(changes.removed),
+        "unchanged": len(changes.unchanged),
+    }
+    _atomic_write(path, (json.dumps(body, ensure_ascii=False) + "\n").encode("utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# Multi-format export
+# ---------------------------------------------------------------------------
+#
+# Each writer streams one format from the shared RenderedEvent list into an
+# open binary file.  write_outputs() runs them on a thread pool so disk writes
+# overlap; the expensive per-event work already happened in render_events().
+
+_Writer = Callable[[list[RenderedEvent], BinaryIO, datetime], None]
+
+
+def _fight_dict(fight: Fight) -> dict:
+    return {
+        "fighter_a": fight.fighter_a,
+        "fighter_b": fight.fighter_b,
+        "weight_class": fight.weight_class,
+        "rounds": fight.rounds,
+    }
+
+
+def _write_ics_body(rendered: list[RenderedEvent], fh: BinaryIO, stamp: datetime) -> None:
+    fh.write(_calendar_from(rendered, stamp).to_ical())
+
+
+def _write_json_feed(rendered: list[RenderedEvent], fh: BinaryIO, stamp: datetime) -> None:
+    """JSON Feed 1.1; structured card data lives under the `_boxing` extension."""
+    header = json.dumps({
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": CALENDAR_NAME,
+        "home_page_url": SCHEDULE_URL,
+    }, ensure_ascii=False)
+    fh.write(header[:-1].encode("utf-8") + b', "items": [')
+    for i, r in enumerate(rendered):
+        ev = r.event
+        item = {
+            "id": r.uid,
+            "title": r.summary,
+            "content_text": r.description,
+            "date_modified": stamp.isoformat(),
+            "_boxing": {
+                "start": r.local_start.isoformat(),
+                "end": r.local_end.isoformat(),
+                "timezone": str(r.local_start.tzinfo),
+                "venue": ev.venue,
+                "city": ev.city,
+                "country": ev.country,
+                "sold_out": ev.is_sold_out,
+                "sources": ev.provenance,
+                "main_event": _fight_dict(r.main),
+                "undercard": [_fight_dict(f) for f in r.undercards],
+            },
+        }
+        fh.write((b", " if i else b"") + json.dumps(item, ensure_ascii=False).encode("utf-8"))
+    fh.write(b"]}\n")
+
+
+_CSV_COLUMNS = (
+    "uid", "start_local", "end_local", "timezone", "start_utc", "main_event",
+    "weight_class", "rounds", "undercard", "venue", "city", "country", "sold_out",
+)
+
+
+def _write_csv(rendered: list[RenderedEvent], fh: BinaryIO, stamp: datetime) -> None:
+    text = io.TextIOWrapper(fh, encoding="utf-8", newline="")
+    writer = csv.writer(text)
+    writer.writerow(_CSV_COLUMNS)
+    for r in rendered:
+        ev = r.event
+        writer.writerow((
+            r.uid,
+            r.local_start.isoformat(),
+            r.local_end.isoformat(),
+            str(r.local_start.tzinfo),
+            ev.start_utc.isoformat(),
+            r.main.title,
+            r.main.weight_class or "",
+            r.main.rounds or "",
+            "; ".join(f.title for f in r.undercards),
+            ev.venue or "",
+            ev.city or "",
+            ev.country or "",
+            "yes" if ev.is_sold_out else "no",
+        ))
+    text.flush()
+    text.detach()  # leave `fh` open for _atomic_open to close
+
+
+def _write_rss(rendered: list[RenderedEvent], fh: BinaryIO, stamp: datetime) -> None:
+    fh.write(
+        '<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel>'
+        f"<title>{xml_escape(CALENDAR_NAME)}</title>"
+        f"<link>{xml_escape(SCHEDULE_URL)}</link>"
+        "<description>Upcoming boxing cards</description>"
+        f"<lastBuildDate>{format_datetime(stamp)}</lastBuildDate>".encode()
+    )
+    for r in rendered:
+        fh.write(
+            "<item>"
+            f"<title>{xml_escape(r.summary)}</title>"
+            f"<description>{xml_escape(r.description)}</description>"
+            f'<guid isPermaLink="false">{xml_escape(r.uid)}</guid>'
+            f"<pubDate>{format_datetime(r.local_start)}</pubDate>"
+            "</item>".encode()
+        )
+    fh.write(b"</channel></rss>\n")
+
+
+_WRITERS: dict[str, _Writer] = {
+    "ics": _write_ics_body,
+    "json": _write_json_feed,
+    "csv": _write_csv,
+    "rss": _write_rss,
+}
+
+
+def _write_format(fmt: str, rendered: list[RenderedEvent], path: Path,
+                  tmp: Path, stamp: datetime) -> int:
+    with tmp.open("wb") as fh:
+        _WRITERS[fmt](rendered, fh, stamp)
+        n_bytes = fh.tell()
+    metrics.set("boxing_output_bytes", n_bytes, format=fmt, file=path.name)
+    return n_bytes
+
+
+def write_outputs(
+    rendered: list[RenderedEvent],
+    outputs: dict[str, Path] | None = None,
+    now_utc: datetime | None = None,
+) -> dict[str, int]:
+    """Write every format in `outputs` (format -> path) concurrently from one
+    rendered list.  Returns bytes written per format.
+
+    Everything is written to temp files first and the .ics is validated
+    before any of them replaces a published file; if it fails, no output
+    changes and FeedValidationError is raised.
+    """
+    outputs = OUTPUT_FILES if outputs is None else outputs
+    unknown = set(outputs) - set(_WRITERS)
+    if unknown:
+        raise ValueError(f"Unknown output formats: {sorted(unknown)}")
+    stamp = now_utc or datetime.now(UTC)
+    with _staged(outputs.values()) as staged:
+        with ThreadPoolExecutor(max_workers=max(len(outputs), 1)) as pool:
+            futures = {
+                fmt: pool.submit(_write_format, fmt, rendered, path, staged[path], stamp)
+                for fmt, path in outputs.items()
+            }
+            sizes = {fmt: future.result() for fmt, future in futures.items()}
+        if "ics" in outputs:
+            path = outputs["ics"]
+            with metrics.timer("boxing_stage_duration_seconds", stage="validate"):
+                problems = validate_ics(staged[path])
+            metrics.set("boxing_validation_errors", len(problems), file=path.name)
+            if problems:
+                raise FeedValidationError(path, problems)
+    return sizes
+
+
+def localized_outputs(lang: str,
+                      outputs: dict[str, Path] | None = None) -> dict[str, Path]:
+    """Output paths for a non-primary language: boxing_schedule.ics ->
+    boxing_schedule.<lang>.ics, and likewise for every format."""
+    outputs = OUTPUT_FILES if outputs is None else outputs
+    return {fmt: path.with_name(f"{path.stem}.{lang}{path.suffix}")
+            for fmt, path in outputs.items()}
+
+
+def write_localized(
+    events: list[Event],
+    locales: dict[str, LocaleStrings],
+    state: dict[str, EventState] | None = None,
+    now_utc: datetime | None = None,
+) -> dict[str, dict[str, int]]:
+    """Render and write every locale's outputs from the shared events, one
+    locale after another: rendering is CPU-bound Python, so threads wouldn't
+    overlap it; only the fetches run concurrently.  SEQUENCE is taken from
+    `state` (the primary feed's change detection) so all languages agree.
+    Returns bytes written per locale and format; a locale whose feed fails
+    validation keeps its previous files and is left out, without holding
+    back the others."""
+    state = state or {}
+    stamp = now_utc or datetime.now(UTC)
+
+    def publish(strings: LocaleStrings) -> dict[str, int]:
+        if strings.lang not in _LABELS:
+            log.warning("No labels for language %s; using English", strings.lang)
+        rendered = [
+            replace(r, sequence=state[r.uid].sequence) if r.uid in state else r
+            for r in render_events(events, strings.lang, strings)
+        ]
+        return write_outputs(rendered, localized_outputs(strings.lang), stamp)
+
+    written: dict[str, dict[str, int]] = {}
+    for lang, strings in locales.items():
+        try:
+            written[lang] = publish(strings)
+        except FeedValidationError as e:
+            for problem in e.problems[:20]:
+                log.error("Invalid feed %s: %s", e.path, problem)
+            log.error("Skipping language %s: feed failed validation", lang)
+    return written
+
+
+# ---------------------------------------------------------------------------
+# Feed validation
+# ---------------------------------------------------------------------------
+#
+# A single-pass checker for the .ics we publish.  It reads one physical line
+# at a time and keeps only the current logical (unfolded) line, the component
+# stack, a few properties of the open VEVENT and the set of UIDs seen -- so it
+# runs in linear time and near-constant memory, and unlike icalendar's parser
+# it rejects bare-LF line endings, overlong lines and dangling components.
+
+_REQUIRED_VEVENT_PROPS = ("UID", "DTSTAMP", "DTSTART")
+_TRACKED_VEVENT_PROPS = frozenset(_REQUIRED_VEVENT_PROPS + ("DTEND",))
+
+
+def _split_content_line(line: str) -> tuple[str, dict[str, str], str] | None:
+    """Split `NAME;P1=V1;P2="V:2":VALUE` into (NAME, params, VALUE).
+
+    Returns None if there is no unquoted colon.
+    """
+    colon = line.find(":")
+    if colon < 0:
+        return None
+    head = line[:colon]
+    if '"' not in head:  # fast path: no quoted parameter values
+        name, *raw_params = head.split(";")
+        params = {}
+        for raw in raw_params:
+            key, _, val = raw.partition("=")
+            params[key.upper()] = val
+        return name.upper(), params, line[colon + 1:]
+    in_quotes = False
+    parts: list[str] = []
+    start = 0
+    for i, ch in enumerate(line):
+        if ch == '"':
+            in_quotes = not in_quotes
+        elif not in_quotes and ch in ";:":
+            parts.append(line[start:i])
+            start = i + 1
+            if ch == ":":
+                name, *raw_params = parts
+                params = {}
+                for raw in raw_params:
+                    key, _, val = raw.partition("=")
+                    params[key.upper()] = val.strip('"')
+                return name.upper(), params, line[start:]
+    return None
+
+
+def _iana_zone(tzid: str) -> ZoneInfo | None:
+    """The IANA zone named `tzid`, or None.  Odd names fail in odd ways: a
+    directory ("America") or an overlong name raises OSError, not
+    ZoneInfoNotFoundError."""
+    try:
+        return ZoneInfo(tzid)
+    except (ZoneInfoNotFoundError, ValueError, OSError):
+        return None
+
+
+def _ics_instant(params: dict[str, str], value: str) -> datetime | None:
+    """Parse a DATE or DATE-TIME property value into an aware UTC datetime.
+
+    Floating times are treated as UTC, which is enough to order DTSTART and
+    DTEND of the same event.  Returns None for a TZID that isn't an IANA zone
+    (the TZID check reports those); raises ValueError on a malformed value.
+    """
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        naive = datetime.strptime(value, "%Y%m%d")
+    else:
+        naive = datetime.strptime(value.rstrip("Z"), "%Y%m%dT%H%M%S")
+    if value.endswith("Z") or "TZID" not in params:
+        return naive.replace(tzinfo=UTC)
+    tz = _iana_zone(params["TZID"])
+    if tz is None:
+        return None
+    return naive.replace(tzinfo=tz).astimezone(UTC)
+
+
+def _unfold(lines: Iterable[bytes], errors: list[str]) -> Iterator[tuple[int, bytes]]:
+    """Yield (first line number, unfolded bytes) per logical line, reporting
+    line-ending and length problems along the way."""
+    pending: list[bytes] | None = None  # pieces, joined once: += would be quadratic
+    pending_no = 0
+    for lineno, raw in enumerate(lines, start=1):
+        if raw.endswith(b"\r\n"):
+            line = raw[:-2]
+        else:
+            errors.append(f"line {lineno}: not terminated by CRLF")
+            line = raw.rstrip(b"\r\n")
+        if len(line) > ICS_MAX_LINE_OCTETS:
+            errors.append(f"line {lineno}: {len(line)} octets exceeds "
+                          f"{ICS_MAX_LINE_OCTETS} without folding")
+        if line[:1] in (b" ", b"\t"):
+            if pending is None:
+                errors.append(f"line {lineno}: continuation with nothing to continue")
+            else:
+                pending.append(line[1:])
+            continue
+        if pending is not None:
+            yield pending_no, b"".join(pending)
+        pending, pending_no = [line], lineno
+    if pending is not None:
+        yield pending_no, b"".join(pending)
+
+
+class FeedValidationError(ValueError):
+    """A rendered feed failed validation and was not published."""
+
+    def __init__(self, path: Path, problems: list[str]) -> None:
+        super().__init__(f"{path.name}: {len(problems)} validation problems")
+        self.path = path
+        self.problems = problems
+
+
+def validate_ics_lines(lines: Iterable[bytes]) -> list[str]:
+    """Validate an iCalendar stream given as raw physical lines (each with
+    its line terminator, as produced by iterating a binary file)."""
+    errors: list[str] = []
+    stack: list[str] = []
+    event: dict[str, tuple[dict[str, str], str]] = {}
+    event_line = 0
+    seen_uids: dict[str, int] = {}
+    defined_tzids: set[str] = set()
+    referenced_tzids: dict[str, int] = {}
+
+    for lineno, logical in _unfold(lines, errors):
+        try:
+            text = logical.decode("utf-8")
+        except UnicodeDecodeError:
+            errors.append(f"line {lineno}: not valid UTF-8")
+            continue
+        parsed = _split_content_line(text)
+        if parsed is None:
+            errors.append(f"line {lineno}: malformed content line {text[:40]!r}")
+            continue
+        name, params, value = parsed
+
+        if name == "BEGIN":
+            component = value.upper()
+            if not stack and component != "VCALENDAR":
+                errors.append(f"line {lineno}: {component} outside VCALENDAR")
+            stack.append(component)
+            if component == "VEVENT":
+                event, event_line = {}, lineno
+            continue
+        if name == "END":
+            component = value.upper()
+            if not stack or stack[-1] != component:
+                open_name = stack[-1] if stack else "nothing"
+                errors.append(f"line {lineno}: END:{component} while {open_name} is open")
+                continue
+            stack.pop()
+            if component == "VEVENT":
+                errors.extend(_check_vevent(event, event_line, seen_uids))
+            continue
+
+        if "TZID" in params:
+            referenced_tzids.setdefault(params["TZID"], lineno)
+        if not stack:
+            errors.append(f"line {lineno}: {name} outside any component")
+        elif stack[-1] == "VTIMEZONE" and name == "TZID":
+            defined_tzids.add(value)
+        elif stack[-1] == "VEVENT" and name in _TRACKED_VEVENT_PROPS:
+            if name in event:
+                errors.append(f"line {lineno}: {name} repeated in VEVENT")
+            event[name] = (params, value)
+
+    for component in reversed(stack):
+        errors.append(f"end of file: BEGIN:{component} never closed")
+    for tzid, lineno in referenced_tzids.items():
+        if tzid not in defined_tzids and _iana_zone(tzid) is None:
+            errors.append(f"line {lineno}: TZID {tzid!r} has no VTIMEZONE "
+                          f"and is not an IANA zone")
+    return errors
+
+
+def _check_vevent(event: dict[str, tuple[dict[str, str], str]], lineno: int,
+                  seen_uids: dict[str, int]) -> list[str]:
+    errors = [f"line {lineno}: VEVENT missing {prop}"
+              for prop in _REQUIRED_VEVENT_PROPS if prop not in event]
+    if "UID" in event:
+        uid = event["UID"][1]
+        if uid in seen_uids:
+            errors.append(f"line {lineno}: duplicate UID {uid!r} "
+                          f"(first at line {seen_uids[uid]})")
+        else:
+            seen_uids[uid] = lineno
+    instants: dict[str, datetime | None] = {}
+    for prop in ("DTSTAMP", "DTSTART", "DTEND"):
+        if prop not in event:
+            continue
+        try:
+            instants[prop] = _ics_instant(*event[prop])
+        except ValueError:
+            errors.append(f"line {lineno}: unparsable {prop} {event[prop][1]!r}")
+    start, end = instants.get("DTSTART"), instants.get("DTEND")
+    if start is not None and end is not None and end < start:
+        errors.append(f"line {lineno}: DTEND is before DTSTART")
+    return errors
+
+
+def validate_ics(path: Path = OUTPUT_FILE) -> list[str]:
+    """Stream-validate an .ics file.  Returns human-readable problems; an
+    empty list means the feed is safe to publish."""
+    with path.open("rb") as fh:
+        return validate_ics_lines(fh)
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
@@ -431,25 +1855,84 @@ def main() -> int:
         datefmt="%H:%M:%S",
     )
 
-    payload = fetch_events()
-    events = parse_events(payload)
-    events = filter_recent(events)
-    events.sort(key=lambda e: e.start_utc)
+    status = 1
+    try:
+        status = run()
+    finally:
+        metrics.set("boxing_last_run_success", 1 if status == 0 else 0)
+        metrics.set("boxing_last_run_timestamp_seconds", time.time())
+        try:
+            metrics.write(METRICS_FILE)
+        except OSError as e:
+            log.warning("Could not write metrics to %s: %s", METRICS_FILE, e)
+    return status
+
+
+def run() -> int:
+    """One pass of the pipeline.  Returns the process exit status."""
+    stage = "boxing_stage_duration_seconds"
+    primary = LANGUAGES[0]
+    with metrics.timer(stage, stage="fetch"), ThreadPoolExecutor(max_workers=1) as pool:
+        # Extra languages download alongside the source adapters.
+        translations = pool.submit(fetch_languages, LANGUAGES[1:], False)
+        batches = gather_sources(SOURCES)
+        payloads = translations.result()
+    with metrics.timer(stage, stage="resolve"):
+        resolver = FighterResolver.load(FIGHTER_ALIASES_FILE)
+        batches = {name: resolve_fighters(evs, resolver) for name, evs in batches.items()}
+    with metrics.timer(stage, stage="merge"):
+        events = merge_sources(batches)
+    # Event payloads are parsed by the source adapters during "fetch".
+    with metrics.timer(stage, stage="locales"):
+        locales: dict[str, LocaleStrings] = {}
+        for lang, payload in payloads.items():
+            try:
+                locales[lang] = parse_locale_strings(lang, payload)
+            except Exception as e:  # an extra language must never stop the run
+                log.warning("Skipping language %s: %s", lang, e)
+    with metrics.timer(stage, stage="filter"):
+        events = filter_recent(events)
+        events.sort(key=lambda e: e.start_utc)
 
     if not events:
         log.error("No upcoming events to write. Aborting.")
         return 1
 
-    calendar = build_calendar(events)
-    n_bytes = write_ics(calendar)
-    log.info("Wrote %s (%d events, %d bytes)", OUTPUT_FILE, len(events), n_bytes)
-
-    for ev in events:
-        main_fight = ev.main_event
-        title = main_fight.title.upper() if main_fight else "?"
+    with metrics.timer(stage, stage="render"):
+        rendered = render_events(events, primary)
+    with metrics.timer(stage, stage="diff"):
+        changes = detect_changes(rendered, load_state(STATE_FILE))
+        rendered = changes.rendered
+    log.info("Changes since last run: %d added, %d changed, %d removed, %d unchanged",
+             len(changes.added), len(changes.changed), len(changes.removed),
+             len(changes.unchanged))
+    # write_outputs() validates each .ics before publishing anything, so a
+    # bad feed never replaces the last good one.  Only the primary feed can
+    # abort the run; write_localized() skips a language whose feed fails.
+    with metrics.timer(stage, stage="write"):
+        try:
+            written = {OUTPUT_FILES["ics"]: write_outputs(rendered)}
+            for lang, sizes in write_localized(events, locales, changes.state).items():
+                written[localized_outputs(lang)["ics"]] = sizes
+        except FeedValidationError as e:
+            for problem in e.problems[:20]:
+                log.error("Invalid feed %s: %s", e.path, problem)
+            log.error("Feed %s failed validation (%d problems). Aborting.",
+                      e.path, len(e.problems))
+            return 1
+    for ics_path, sizes in written.items():
+        log.info("Wrote %s and %d other formats (%d events, %d bytes)",
+                 ics_path, len(sizes) - 1, len(events), sum(sizes.values()))
+
+    # Only a published feed advances the state the next run diffs against.
+    save_state(changes.state, STATE_FILE)
+    write_changelog(changes, CHANGELOG_FILE)
+    resolver.save(FIGHTER_ALIASES_FILE)
+
+    for r in rendered:
         log.info("  %s  %s  @  %s  (+%d UC)",
-                 ev.local_start.strftime("%Y-%m-%d %H:%M %Z"),
-                 title, ev.venue or "?", len(ev.undercards))
+                 r.local_start.strftime("%Y-%m-%d %H:%M %Z"),
+                 r.main.title.upper(), r.event.venue or "?", len(r.undercards))
     return 0
 
 
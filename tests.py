@@ -2,22 +2,52 @@
 
 from __future__ import annotations
 
+import csv
+import http.client
 import json
+import random
+import threading
+import xml.etree.ElementTree as ET
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 import pytest
 
+import scraper
 from scraper import (
+    EVENT_DURATION,
     Event,
+    FeedValidationError,
     Fight,
+    FighterResolver,
+    Metrics,
+    Source,
     build_calendar,
+    detect_changes,
+    fetch_languages,
     filter_recent,
+    gather_sources,
     infer_timezone,
+    load_state,
+    localize_events,
+    localized_outputs,
+    merge_sources,
+    metrics,
     parse_event,
     parse_events,
     parse_fight,
+    parse_locale_strings,
+    render_event,
+    render_events,
+    resolve_fighters,
+    save_state,
+    validate_ics,
+    validate_ics_lines,
+    write_changelog,
+    write_localized,
+    write_outputs,
 )
 
 FIXTURE = Path(__file__).parent / "fixtures" / "events_api.json"
@@ -175,6 +205,17 @@ class TestParseEvent:
         assert ev.end_utc is None
         assert ev.is_sold_out is False
 
+    def test_end_before_start_is_ignored(self) -> None:
+        raw = {
+            "id": "x",
+            "eventStart": "2026-10-08T22:00:00.000Z",
+            "eventEnd": "2026-10-08T04:00:00.000Z",
+            "fights": [{"fighterA": {"name": "A"}, "fighterB": {"name": "B"}}],
+        }
+        ev = parse_event(raw)
+        assert ev is not None
+        assert ev.end_utc is None
+
     def test_unparsable_start_returns_none(self) -> None:
         raw = {
             "id": "x",
@@ -251,6 +292,228 @@ class TestFixture:
             assert ev.local_start.astimezone(UTC) == ev.start_utc
 
 
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+
+def _card(eid: str, a: str, b: str, start: datetime, **kw: object) -> Event:
+    fields: dict = {
+        "id": eid, "start_utc": start, "end_utc": None, "venue": None, "city": None,
+        "country": None, "fights": (Fight(a, b, is_main_event=True),),
+        "is_sold_out": False,
+    }
+    fields.update(kw)
+    return Event(**fields)
+
+
+class TestMergeSources:
+    START = datetime(2026, 5, 23, 18, 0, tzinfo=UTC)
+
+    def test_dedups_normalized_pair_and_fills_gaps(self) -> None:
+        primary = _card("ring1", "Canelo Alvarez", "Terence Crawford", self.START)
+        backup = _card("b1", "terence  crawford", "CANELO ÁLVAREZ", self.START,
+                       venue="Allegiant Stadium", city="Las Vegas", country="US")
+        merged = merge_sources({"ring": [primary], "backup": [backup]})
+        assert len(merged) == 1
+        ev = merged[0]
+        assert ev.id == "ring1"
+        assert ev.venue == "Allegiant Stadium"
+        assert ev.provenance["venue"] == "backup"
+        assert ev.provenance["start_utc"] == "ring"
+        assert ev.provenance["fights"] == "ring"
+
+    def test_tolerates_adjacent_utc_date(self) -> None:
+        primary = _card("r", "A", "B", self.START)
+        late = _card("x", "A", "B", self.START + timedelta(hours=8))  # next UTC day
+        assert len(merge_sources({"ring": [primary], "other": [late]})) == 1
+
+    def test_keeps_distinct_events(self) -> None:
+        first = _card("r1", "A", "B", self.START)
+        rematch = _card("r2", "A", "B", self.START + timedelta(days=90))
+        other = _card("x1", "C", "D", self.START)
+        merged = merge_sources({"ring": [first, rematch], "other": [other]})
+        assert [ev.id for ev in merged] == ["r1", "r2", "x1"]
+        assert merged[2].provenance["venue"] == "other"
+
+    def test_primary_wins_conflicts(self) -> None:
+        primary = _card("r", "A", "B", self.START, venue="Arena One")
+        backup = _card("x", "A", "B", self.START, venue="Arena Two")
+        assert merge_sources({"ring": [primary], "other": [backup]})[0].venue == "Arena One"
+
+    def test_end_only_filled_with_matching_start(self) -> None:
+        primary = _card("r", "A", "B", self.START)
+        backup = _card("x", "A", "B", self.START - timedelta(days=1),
+                       end_utc=self.START - timedelta(hours=20))
+        ev = merge_sources({"ring": [primary], "manual": [backup]})[0]
+        assert (ev.start_utc, ev.end_utc) == (self.START, None)
+        same_start = _card("y", "A", "B", self.START, end_utc=self.START + timedelta(hours=4))
+        ev = merge_sources({"ring": [primary], "manual": [same_start]})[0]
+        assert ev.end_utc == self.START + timedelta(hours=4)
+        assert ev.provenance["end_utc"] == "manual"
+
+
+class TestFighterResolver:
+    def test_transliteration_variants_resolve_together(self) -> None:
+        r = FighterResolver({})
+        assert r.resolve("Oleksandr Usyk") == "Oleksandr Usyk"
+        assert r.resolve("Alexander Usyk") == "Oleksandr Usyk"
+        assert r.resolve("Aleksandr Usik") == "Oleksandr Usyk"
+        assert r.resolve("Vasyl Lomachenko") == "Vasyl Lomachenko"
+        assert r.resolve("Vasiliy Lomatchenko") == "Vasyl Lomachenko"
+        assert r.resolve("Arthur Beterbiev") == "Arthur Beterbiev"
+        assert r.resolve("Artur Beterbiev") == "Arthur Beterbiev"
+        assert r.resolve("Joe Smith") == "Joe Smith"
+        assert r.resolve("Joe Smith Jr.") == "Joe Smith"
+
+    def test_accents_and_case(self) -> None:
+        r = FighterResolver({})
+        assert r.resolve("Román González") == "Román González"
+        assert r.resolve("ROMAN GONZALEZ") == "Román González"
+
+    def test_relatives_stay_distinct(self) -> None:
+        r = FighterResolver({})
+        names = ["Jermell Charlo", "Jermall Charlo", "Naoya Inoue", "Takuma Inoue",
+                 "Ryan Garcia", "Danny Garcia", "Julio Cesar Chavez Jr",
+                 "Julio Cesar Martinez Jr", "Julio Cesar Chavez Sr"]
+        assert [r.resolve(n) for n in names] == names
+
+    def test_curated_aliases_and_quoted_nicknames(self) -> None:
+        r = FighterResolver()
+        assert r.resolve("Alexander Usyk") == "Oleksandr Usyk"
+        assert r.resolve('Saul "Canelo" Alvarez') == "Canelo Alvarez"
+        assert r.resolve("Saul 'Canelo' Alvarez") == "Canelo Alvarez"
+
+    def test_alias_cache_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "aliases.json"
+        r = FighterResolver({})
+        r.resolve("Dmitry Bivol")
+        r.resolve("Dmitrii Bivol")
+        assert r.learned == 2
+        r.save(path)
+        reloaded = FighterResolver.load(path)
+        assert reloaded.aliases == r.aliases
+        assert reloaded.resolve("Dmitrii Bivol") == "Dmitry Bivol"
+        assert reloaded.learned == 0
+
+    def test_corrupt_cache_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "aliases.json"
+        path.write_text("[1, 2]")
+        assert FighterResolver.load(path).aliases == FighterResolver().aliases
+
+    def test_cache_keys_normalized_and_invalid_skipped(self, tmp_path: Path) -> None:
+        path = tmp_path / "aliases.json"
+        path.write_text(json.dumps({"dmitrii bivol": "Dmitry Bivol", "a b": None,
+                                    "c d": 3, "e f": "", " ": "Nobody", "?!": "Nobody",
+                                    "Teófimo LÓPEZ Jr.": "Teofimo Lopez"}))
+        r = FighterResolver.load(path)
+        assert r.resolve("Dmitrii Bivol") == "Dmitry Bivol"
+        assert r.resolve("Teofimo Lopez Jr") == "Teofimo Lopez"
+        assert set(r.aliases) - set(FighterResolver().aliases) == {
+            "dmitrii bivol", "teofimo lopez jr"}
+
+    def test_translit_rules_all_reachable(self) -> None:
+        assert scraper._transliterate("jacks") == "jax"
+        assert scraper._transliterate("jackson") == "jaxon"
+
+    def test_trigram_blocks_capped(self) -> None:
+        rng = random.Random(0)
+        r = FighterResolver()
+        for _ in range(100):  # distinct surnames that all share the " sm" block
+            r.resolve("John Sm" + "".join(rng.choice("bdfgklmnprtvz") + rng.choice("aeiou")
+                                          for _ in range(4)))
+        assert max(len(m) for m in r._blocks.values()) == scraper._MAX_TRIGRAM_BLOCK
+
+    def test_resolution_feeds_merge(self) -> None:
+        start = datetime(2026, 5, 23, 18, 0, tzinfo=UTC)
+        ring = _card("r", "Oleksandr Usyk", "Rico Verhoeven", start)
+        other = _card("x", "Alexander Usyk", "Rico Verhoeven", start, venue="Giza")
+        r = FighterResolver({})
+        batches = {"ring": resolve_fighters([ring], r),
+                   "other": resolve_fighters([other], r)}
+        merged = merge_sources(batches)
+        assert len(merged) == 1
+        assert merged[0].venue == "Giza"
+        assert merged[0].main_event == Fight("Oleksandr Usyk", "Rico Verhoeven", True)
+
+
+class TestGatherSources:
+    def test_collects_in_source_order(self) -> None:
+        ev = _card("r", "A", "B", datetime(2026, 5, 23, tzinfo=UTC))
+        batches = gather_sources((Source("one", lambda: [ev]), Source("two", list)))
+        assert list(batches) == ["one", "two"]
+        assert batches["one"] == [ev]
+
+    def test_optional_failure_skipped(self) -> None:
+        def broken() -> list[Event]:
+            raise RuntimeError("down")
+
+        batches = gather_sources((Source("ok", list), Source("broken", broken)))
+        assert list(batches) == ["ok"]
+
+    def test_required_failure_raises(self) -> None:
+        def broken() -> list[Event]:
+            raise RuntimeError("down")
+
+        with pytest.raises(RuntimeError, match="down"):
+            gather_sources((Source("broken", broken, required=True),))
+
+    def test_timeout_per_source(self) -> None:
+        release = threading.Event()
+
+        def stuck() -> list[Event]:
+            release.wait(5)
+            return []
+
+        try:
+            batches = gather_sources((Source("slow", stuck, timeout=0.05),
+                                      Source("fast", list)))
+            assert list(batches) == ["fast"]
+            with pytest.raises(RuntimeError, match="timed out"):
+                gather_sources((Source("slow", stuck, timeout=0.05, required=True),))
+        finally:
+            release.set()
+
+    def test_manual_source_missing_file_is_empty(self, tmp_path: Path) -> None:
+        assert scraper._load_manual_events(tmp_path / "none.json") == []
+
+    def test_malformed_manual_source_skipped(self, tmp_path: Path) -> None:
+        path = tmp_path / "manual.json"
+        path.write_text("[]")
+        with pytest.raises(ValueError, match="JSON object"):
+            scraper._load_manual_events(path)
+
+        def crashing() -> list[Event]:
+            raise AttributeError("'list' object has no attribute 'get'")
+
+        batches = gather_sources((Source("ok", list), Source("manual", crashing)))
+        assert list(batches) == ["ok"]
+
+    def test_manual_cards_without_id_get_stable_ids(self, tmp_path: Path) -> None:
+        def record(a: str, b: str) -> dict:
+            return {"eventStart": "2026-05-23T18:00:00Z",
+                    "fights": [{"fighterA": {"name": a}, "fighterB": {"name": b},
+                                "isMainEvent": True}]}
+
+        path = tmp_path / "manual.json"
+        path.write_text(json.dumps({"data": [record("A", "B"), record("C", "D")]}))
+        first = scraper._load_manual_events(path)
+        ids = [ev.id for ev in first]
+        assert len(set(ids)) == 2 and all(i.startswith("manual-") for i in ids)
+        assert [ev.id for ev in scraper._load_manual_events(path)] == ids
+
+    def test_manual_ids_cannot_collide_with_api(self, payload: dict,
+                                                events: list[Event], tmp_path: Path) -> None:
+        copied = json.loads(json.dumps(payload["data"][0]))
+        copied["eventStart"] = "2030-01-01T18:00:00Z"  # too far off to merge
+        path = tmp_path / "manual.json"
+        path.write_text(json.dumps({"data": [copied]}))
+        manual = scraper._load_manual_events(path)
+        assert manual[0].id == f"manual-{copied['id']}"
+        merged = merge_sources({"ring": events, "manual": manual})
+        assert len({ev.id for ev in merged}) == len(merged) == len(events) + 1
+
+
 # ---------------------------------------------------------------------------
 # filter_recent
 # ---------------------------------------------------------------------------
@@ -375,3 +638,469 @@ class TestBuildCalendar:
             assert component["DTSTART"]
             assert component["DTEND"]
             assert component["DTSTAMP"]
+
+
+class TestLocalizeEvents:
+    # Instants either side of the 2026 transitions, including both readings
+    # of New York's repeated 01:30 on 1 November.
+    INSTANTS = [
+        datetime(2026, 3, 8, 6, 59, tzinfo=UTC),
+        datetime(2026, 3, 8, 7, 0, tzinfo=UTC),
+        datetime(2026, 3, 29, 0, 59, tzinfo=UTC),
+        datetime(2026, 3, 29, 1, 0, tzinfo=UTC),
+        datetime(2026, 10, 25, 0, 30, tzinfo=UTC),
+        datetime(2026, 10, 25, 1, 30, tzinfo=UTC),
+        datetime(2026, 11, 1, 5, 30, tzinfo=UTC),
+        datetime(2026, 11, 1, 6, 30, tzinfo=UTC),
+    ]
+    VENUES = [("US", "New York"), ("GB", "London"), ("US", "Las Vegas"),
+              ("JP", "Tokyo"), ("ZZ", "Nowhere")]
+
+    def _events(self) -> list[Event]:
+        return [
+            Event(id=f"{country}-{i}", start_utc=start,
+                  end_utc=start + timedelta(hours=5) if i % 2 else None,
+                  venue=None, city=city, country=country, fights=(),
+                  is_sold_out=False)
+            for country, city in self.VENUES
+            for i, start in enumerate(self.INSTANTS)
+        ]
+
+    def test_matches_astimezone(self) -> None:
+        evs = self._events()
+        for ev, (start, end) in zip(evs, localize_events(evs), strict=True):
+            tz = infer_timezone(ev.country, ev.city)
+            expected_end = (ev.end_utc.astimezone(tz) if ev.end_utc
+                            else ev.start_utc.astimezone(tz) + EVENT_DURATION)
+            for got, want in ((start, ev.start_utc.astimezone(tz)), (end, expected_end)):
+                assert got == want
+                assert (got.replace(tzinfo=None), got.fold, got.utcoffset()) == (
+                    want.replace(tzinfo=None), want.fold, want.utcoffset())
+                assert got.tzinfo is tz
+
+    def test_ambiguous_local_time_keeps_fold(self) -> None:
+        evs = [e for e in self._events() if e.country == "US" and e.city == "New York"]
+        first, second = (start for start, _ in localize_events(evs)[-2:])
+        assert first.replace(tzinfo=None) == second.replace(tzinfo=None)
+        assert (first.fold, second.fold) == (0, 1)
+
+    def test_render_events_uses_batch(self, events: list[Event]) -> None:
+        batched = render_events(events)
+        assert [(r.local_start, r.local_end, r.description) for r in batched] == [
+            (r.local_start, r.local_end, r.description)
+            for r in (render_event(ev) for ev in events)]
+
+    def test_empty(self) -> None:
+        assert localize_events([]) == []
+
+
+# ---------------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------------
+
+
+class TestDetectChanges:
+    DAY1 = datetime(2026, 5, 1, 6, tzinfo=UTC)
+    DAY2 = datetime(2026, 5, 2, 6, tzinfo=UTC)
+    DAY3 = datetime(2026, 5, 3, 6, tzinfo=UTC)
+
+    def test_first_run_everything_added(self, events: list[Event]) -> None:
+        changes = detect_changes(render_events(events), {}, now_utc=self.DAY1)
+        assert len(changes.added) == len(events)
+        assert not changes.changed and not changes.removed and not changes.unchanged
+        assert all(r.sequence == 0 for r in changes.rendered)
+
+    def test_rerun_is_unchanged(self, events: list[Event]) -> None:
+        first = detect_changes(render_events(events), {}, now_utc=self.DAY1)
+        second = detect_changes(render_events(events), first.state, now_utc=self.DAY2)
+        assert len(second.unchanged) == len(events)
+        assert not second.has_changes
+        assert all(r.sequence == 0 for r in second.rendered)
+
+    def test_change_bumps_sequence(self, events: list[Event], tmp_path: Path) -> None:
+        first = detect_changes(render_events(events), {}, now_utc=self.DAY1)
+        moved = [replace(events[0], start_utc=events[0].start_utc + timedelta(hours=1)),
+                 *events[1:]]
+        second = detect_changes(render_events(moved), first.state, now_utc=self.DAY2)
+        uid = second.rendered[0].uid
+        assert second.changed == (uid,)
+        assert second.rendered[0].sequence == 1
+        assert all(r.sequence == 0 for r in second.rendered[1:])
+        out = tmp_path / "feed.ics"
+        write_outputs(second.rendered[:1], {"ics": out})
+        assert "SEQUENCE:1" in out.read_text(encoding="utf-8")
+
+    def test_removed_reported_once_then_retained(self, events: list[Event]) -> None:
+        first = detect_changes(render_events(events), {}, now_utc=self.DAY1)
+        gone = first.rendered[0].uid
+        second = detect_changes(render_events(events[1:]), first.state, now_utc=self.DAY2)
+        assert second.removed == (gone,)
+        assert gone in second.state
+        third = detect_changes(render_events(events[1:]), second.state, now_utc=self.DAY3)
+        assert third.removed == ()
+        assert gone in third.state
+
+    def test_retention_expires(self, events: list[Event]) -> None:
+        first = detect_changes(render_events(events), {}, now_utc=self.DAY1)
+        later = self.DAY1 + timedelta(days=60)
+        second = detect_changes(render_events(events[1:]), first.state, now_utc=later)
+        assert first.rendered[0].uid not in second.state
+
+    def test_returning_event_keeps_sequence(self, events: list[Event]) -> None:
+        first = detect_changes(render_events(events), {}, now_utc=self.DAY1)
+        moved = [replace(events[0], venue="Elsewhere"), *events[1:]]
+        second = detect_changes(render_events(moved), first.state, now_utc=self.DAY2)
+        third = detect_changes(render_events(events[1:]), second.state, now_utc=self.DAY3)
+        back = self.DAY3 + timedelta(days=1)
+        fourth = detect_changes(render_events(moved), third.state, now_utc=back)
+        assert fourth.added == (second.rendered[0].uid,)
+        assert fourth.rendered[0].sequence == 1
+
+    def test_state_round_trip(self, events: list[Event], tmp_path: Path) -> None:
+        changes = detect_changes(render_events(events), {}, now_utc=self.DAY1)
+        path = tmp_path / "state.json"
+        save_state(changes.state, path)
+        assert load_state(path) == changes.state
+
+    def test_missing_or_corrupt_state(self, tmp_path: Path) -> None:
+        assert load_state(tmp_path / "nope.json") == {}
+        bad = tmp_path / "bad.json"
+        bad.write_text("{not json")
+        assert load_state(bad) == {}
+
+    def test_changelog(self, events: list[Event], tmp_path: Path) -> None:
+        first = detect_changes(render_events(events), {}, now_utc=self.DAY1)
+        second = detect_changes(render_events(events[1:]), first.state, now_utc=self.DAY2)
+        path = tmp_path / "changes.json"
+        write_changelog(second, path, now_utc=self.DAY2)
+        log = json.loads(path.read_text(encoding="utf-8"))
+        assert log["added"] == [] and log["changed"] == []
+        assert log["removed"] == [first.rendered[0].uid]
+        assert log["unchanged"] == len(events) - 1
+
+
+# ---------------------------------------------------------------------------
+# Multi-format export
+# ---------------------------------------------------------------------------
+
+
+class TestWriteOutputs:
+    def test_all_formats_agree(self, events: list[Event], tmp_path: Path) -> None:
+        outputs = {fmt: tmp_path / f"feed.{fmt}" for fmt in ("ics", "json", "csv", "rss")}
+        sizes = write_outputs(render_events(events), outputs)
+        assert sizes == {fmt: path.stat().st_size for fmt, path in outputs.items()}
+
+        feed = json.loads(outputs["json"].read_text(encoding="utf-8"))
+        rows = list(csv.DictReader(outputs["csv"].open(encoding="utf-8", newline="")))
+        items = ET.parse(outputs["rss"]).findall("./channel/item")
+        ics = outputs["ics"].read_text(encoding="utf-8")
+        assert len(feed["items"]) == len(rows) == len(items) == len(events)
+        assert ics.count("BEGIN:VEVENT") == len(events)
+
+        uids = [item["id"] for item in feed["items"]]
+        assert uids == [row["uid"] for row in rows]
+        assert uids == [item.findtext("guid") for item in items]
+
+    def test_json_feed_carries_card(self, events: list[Event], tmp_path: Path) -> None:
+        ev = next(e for e in events if e.venue == "Tokyo Dome")
+        out = tmp_path / "feed.json"
+        write_outputs(render_events([ev]), {"json": out})
+        feed = json.loads(out.read_text(encoding="utf-8"))
+        assert feed["version"] == "https://jsonfeed.org/version/1.1"
+        card = feed["items"][0]["_boxing"]
+        assert card["timezone"] == "Asia/Tokyo"
+        assert card["main_event"]["fighter_a"] == "Naoya Inoue"
+        assert len(card["undercard"]) == len(ev.undercards)
+
+    def test_ics_output_matches_build_calendar(self, events: list[Event],
+                                               tmp_path: Path) -> None:
+        now = datetime(2026, 5, 14, tzinfo=UTC)
+        out = tmp_path / "feed.ics"
+        write_outputs(render_events(events), {"ics": out}, now_utc=now)
+        assert out.read_bytes() == build_calendar(events, now_utc=now).to_ical()
+
+    def test_unknown_format_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="pdf"):
+            write_outputs([], {"pdf": tmp_path / "x.pdf"})
+
+    def test_invalid_feed_is_not_published(self, events: list[Event],
+                                           tmp_path: Path) -> None:
+        outputs = {"ics": tmp_path / "feed.ics", "json": tmp_path / "feed.json"}
+        write_outputs(render_events(events), outputs)
+        published = {fmt: path.read_bytes() for fmt, path in outputs.items()}
+        duplicated = render_events([events[0], events[0]])
+        with pytest.raises(FeedValidationError, match="feed.ics") as exc:
+            write_outputs(duplicated, outputs)
+        assert any("duplicate UID" in p for p in exc.value.problems)
+        assert {fmt: path.read_bytes() for fmt, path in outputs.items()} == published
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["feed.ics", "feed.json"]
+
+
+# ---------------------------------------------------------------------------
+# Localization
+# ---------------------------------------------------------------------------
+
+
+def _translated_payload(payload: dict) -> dict:
+    translated = json.loads(json.dumps(payload))
+    for raw in translated["data"]:
+        for fight in raw.get("fights") or []:
+            if fight.get("weightClass"):
+                fight["weightClass"] = "Peso " + fight["weightClass"]
+        if raw.get("id") == "634Z6qrMYoGP1s4wFLcCxm":
+            raw["eventLocation"]["venueName"] = "Domo de Tokio"
+    return translated
+
+
+class TestLocalization:
+    def test_parse_locale_strings(self, payload: dict) -> None:
+        strings = parse_locale_strings("es", _translated_payload(payload))
+        assert strings.weight_classes["42dFem3mLYrbUI7h5uMWi4"] == "Peso Junior featherweight"
+        assert strings.fighter_names["42dFem3mLYrbUI7h5uMWi4"] == (
+            "Naoya Inoue", "Junto Nakatani")
+        assert strings.venues["634Z6qrMYoGP1s4wFLcCxm"] == "Domo de Tokio"
+
+    @pytest.mark.parametrize("bad", [[], "oops", {"data": [None]},
+                                     {"data": [{"id": "e1", "fights": [None]}]}])
+    def test_malformed_locale_payload(self, bad: object) -> None:
+        strings = parse_locale_strings("es", bad)  # type: ignore[arg-type]
+        assert (strings.fighter_names, strings.weight_classes, strings.venues) == ({}, {}, {})
+
+    def test_render_localized(self, payload: dict, events: list[Event]) -> None:
+        strings = parse_locale_strings("es", _translated_payload(payload))
+        ev = next(e for e in events if e.venue == "Tokyo Dome")
+        r = render_event(ev, "es", strings)
+        assert "COMBATE ESTELAR: NAOYA INOUE VS JUNTO NAKATANI" in r.description
+        assert "Peso Junior featherweight, 12 asaltos" in r.description
+        assert f"(+{len(ev.undercards)} más)" in r.summary
+        assert r.location == "Domo de Tokio, Tokyo, JP"
+        assert r.main.weight_class == "Peso Junior featherweight"
+        # Language-independent fields are shared with the primary rendering
+        primary = render_event(ev)
+        assert (r.uid, r.local_start, r.local_end) == (
+            primary.uid, primary.local_start, primary.local_end)
+
+    def test_unknown_language_uses_english_labels(self, events: list[Event]) -> None:
+        assert render_event(events[0], "xx").description == render_event(
+            events[0]).description
+
+    def test_localized_outputs(self) -> None:
+        paths = localized_outputs("es", {"ics": Path("out/feed.ics")})
+        assert paths == {"ics": Path("out/feed.es.ics")}
+
+    def test_write_localized_shares_sequence(
+        self, payload: dict, events: list[Event], tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(scraper, "OUTPUT_FILES", {"ics": tmp_path / "feed.ics"})
+        changes = detect_changes(render_events(events[:1]), {})
+        state = {uid: replace(st, sequence=4) for uid, st in changes.state.items()}
+        strings = parse_locale_strings("es", _translated_payload(payload))
+        sizes = write_localized(events[:1], {"es": strings}, state)
+        out = tmp_path / "feed.es.ics"
+        assert sizes == {"es": {"ics": out.stat().st_size}}
+        text = out.read_text(encoding="utf-8")
+        assert "SEQUENCE:4" in text
+        assert "COMBATE ESTELAR" in text
+
+    def test_fetch_languages_skips_failed_secondary(
+        self, payload: dict, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        def fake_fetch(url: str) -> dict:
+            if "language=fr" in url:
+                raise RuntimeError("unavailable")
+            return payload
+
+        monkeypatch.setattr(scraper, "fetch_events", fake_fetch)
+        assert set(fetch_languages(("en", "es", "fr"))) == {"en", "es"}
+        with pytest.raises(RuntimeError):
+            fetch_languages(("fr", "en"))
+
+    def test_fetch_languages_skips_secondary_timeout(
+        self, payload: dict, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        def fake_fetch(url: str) -> dict:
+            if "language=es" in url:
+                raise TimeoutError("The read operation timed out")
+            if "language=fr" in url:
+                raise http.client.IncompleteRead(b"")
+            return payload
+
+        monkeypatch.setattr(scraper, "fetch_events", fake_fetch)
+        assert set(fetch_languages(("en", "es", "fr"))) == {"en"}
+        assert fetch_languages(("es", "fr"), required=False) == {}
+
+    def test_invalid_locale_does_not_block_others(
+        self, payload: dict, events: list[Event], tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(scraper, "OUTPUT_FILES", {"ics": tmp_path / "feed.ics"})
+        validate = scraper.validate_ics
+        monkeypatch.setattr(scraper, "validate_ics", lambda path: (
+            ["line 1: broken"] if ".fr." in path.name else validate(path)))
+        locales = {lang: parse_locale_strings(lang, _translated_payload(payload))
+                   for lang in ("es", "fr")}
+        sizes = write_localized(events[:1], locales)
+        assert set(sizes) == {"es"}
+        assert (tmp_path / "feed.es.ics").exists()
+        assert not (tmp_path / "feed.fr.ics").exists()
+
+
+# ---------------------------------------------------------------------------
+# Feed validation
+# ---------------------------------------------------------------------------
+
+
+def _ics_lines(*lines: str) -> list[bytes]:
+    return [line.encode("utf-8") + b"\r\n" for line in lines]
+
+
+def _vevent(uid: str = "u1", start: str = "20260523T180000",
+            end: str = "20260523T220000", tzid: str = "Africa/Cairo") -> list[str]:
+    return [
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        "DTSTAMP:20260514T000000Z",
+        f"DTSTART;TZID={tzid}:{start}",
+        f"DTEND;TZID={tzid}:{end}",
+        "END:VEVENT",
+    ]
+
+
+def _calendar(*body: str) -> list[bytes]:
+    return _ics_lines("BEGIN:VCALENDAR", "VERSION:2.0", *body, "END:VCALENDAR")
+
+
+class TestValidateIcs:
+    def test_generated_feed_is_valid(self, events: list[Event], tmp_path: Path) -> None:
+        out = tmp_path / "feed.ics"
+        out.write_bytes(build_calendar(events).to_ical())
+        assert validate_ics(out) == []
+
+    def test_minimal_calendar_is_valid(self) -> None:
+        assert validate_ics_lines(_calendar(*_vevent())) == []
+
+    def test_bare_lf_rejected(self) -> None:
+        lines = [line[:-2] + b"\n" for line in _calendar(*_vevent())]
+        problems = validate_ics_lines(lines)
+        assert problems and all("CRLF" in p for p in problems)
+
+    def test_overlong_line_rejected(self) -> None:
+        problems = validate_ics_lines(_calendar(*_vevent(), "X-NOTE:" + "a" * 80))
+        assert any("exceeds 75" in p for p in problems)
+
+    def test_folded_line_is_unfolded(self) -> None:
+        lines = _calendar(*_vevent()[:1], "UID:abc", " def", *_vevent()[2:])
+        assert validate_ics_lines(lines) == []
+
+    def test_long_folded_property(self) -> None:
+        # 50k continuation lines (~3.7 MB): quadratic unfolding takes seconds
+        folded = ["DESCRIPTION:" + "a" * 60] + [" " + "b" * 73] * 50_000
+        assert validate_ics_lines(_calendar(*_vevent()[:-1], *folded, "END:VEVENT")) == []
+
+    def test_missing_required_property(self) -> None:
+        body = [line for line in _vevent() if not line.startswith("DTSTAMP")]
+        assert validate_ics_lines(_calendar(*body)) == ["line 3: VEVENT missing DTSTAMP"]
+
+    def test_duplicate_uid(self) -> None:
+        problems = validate_ics_lines(_calendar(*_vevent("a"), *_vevent("a")))
+        assert len(problems) == 1 and "duplicate UID 'a'" in problems[0]
+
+    def test_dtend_before_dtstart(self) -> None:
+        problems = validate_ics_lines(_calendar(*_vevent(end="20260523T120000")))
+        assert problems == ["line 3: DTEND is before DTSTART"]
+
+    def test_dtend_compared_across_zones(self) -> None:
+        body = _vevent()
+        body[4] = "DTEND:20260523T160000Z"  # 19:00 Cairo, after the 18:00 start
+        assert validate_ics_lines(_calendar(*body)) == []
+
+    def test_unbalanced_components(self) -> None:
+        problems = validate_ics_lines(_ics_lines("BEGIN:VCALENDAR", *_vevent()[:-1]))
+        assert "end of file: BEGIN:VEVENT never closed" in problems
+        assert "end of file: BEGIN:VCALENDAR never closed" in problems
+        problems = validate_ics_lines(_calendar("END:VEVENT"))
+        assert problems == ["line 3: END:VEVENT while VCALENDAR is open"]
+
+    def test_unknown_tzid(self) -> None:
+        problems = validate_ics_lines(_calendar(*_vevent(tzid="Mars/Olympus")))
+        assert any("TZID 'Mars/Olympus'" in p for p in problems)
+
+    @pytest.mark.parametrize("tzid", ["America", "Europe/" + "x" * 300])
+    def test_tzid_that_breaks_zoneinfo(self, tzid: str) -> None:
+        problems = validate_ics_lines(_calendar(*_vevent(tzid=tzid)))
+        assert any(f"TZID {tzid!r}" in p for p in problems)
+
+    def test_tzid_defined_by_vtimezone(self) -> None:
+        vtimezone = ["BEGIN:VTIMEZONE", "TZID:Custom", "END:VTIMEZONE"]
+        assert validate_ics_lines(_calendar(*vtimezone, *_vevent(tzid="Custom"))) == []
+
+    def test_unparsable_datetime(self) -> None:
+        problems = validate_ics_lines(_calendar(*_vevent(start="tomorrow")))
+        assert problems == ["line 3: unparsable DTSTART 'tomorrow'"]
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+
+class TestMetrics:
+    def test_counter_and_gauge_render(self) -> None:
+        m = Metrics()
+        m.inc("boxing_events_dropped_total", stage="parse", reason="no_start")
+        m.inc("boxing_events_dropped_total", stage="parse", reason="no_start")
+        m.set("boxing_payload_bytes", 1234)
+        text = m.render()
+        assert "# TYPE boxing_events_dropped_total counter" in text
+        assert ('boxing_events_dropped_total{reason="no_start",stage="parse"} 2'
+                in text)
+        assert "boxing_payload_bytes 1234" in text
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        m = Metrics(buckets=(0.1, 1.0))
+        m.observe("boxing_stage_duration_seconds", 0.05, stage="fetch")
+        m.observe("boxing_stage_duration_seconds", 0.5, stage="fetch")
+        m.observe("boxing_stage_duration_seconds", 5.0, stage="fetch")
+        text = m.render()
+        assert 'boxing_stage_duration_seconds_bucket{stage="fetch",le="0.1"} 1' in text
+        assert 'boxing_stage_duration_seconds_bucket{stage="fetch",le="1"} 2' in text
+        assert 'boxing_stage_duration_seconds_bucket{stage="fetch",le="+Inf"} 3' in text
+        assert 'boxing_stage_duration_seconds_count{stage="fetch"} 3' in text
+        assert 'boxing_stage_duration_seconds_sum{stage="fetch"} 5.55' in text
+
+    def test_undeclared_metric_rejected(self) -> None:
+        with pytest.raises(KeyError):
+            Metrics().inc("boxing_typo_total")
+
+    def test_label_values_escaped(self) -> None:
+        m = Metrics()
+        m.set("boxing_output_bytes", 1, format='a"b\\c')
+        assert 'format="a\\"b\\\\c"' in m.render()
+
+    def test_write_is_atomic_replace(self, tmp_path: Path) -> None:
+        m = Metrics()
+        m.set("boxing_last_run_success", 1)
+        target = tmp_path / "boxing.prom"
+        target.write_text("stale")
+        m.write(target)
+        assert target.read_text() == m.render()
+        assert [p.name for p in tmp_path.iterdir()] == ["boxing.prom"]
+
+    def test_parse_records_drop_reasons(self) -> None:
+        metrics.reset()
+        parse_events({"data": [
+            {"id": "a"},
+            {"id": "b", "eventStart": "garbage"},
+            {"id": "c", "eventStart": "2026-05-23T18:00:00.000Z", "fights": []},
+        ]})
+        for reason in ("no_start", "bad_start", "no_fights"):
+            assert metrics.get("boxing_events_dropped_total",
+                               stage="parse", reason=reason) == 1
+        assert metrics.get("boxing_api_records") == 3
+        assert metrics.get("boxing_events", stage="parse") == 0
+
+    def test_timezone_fallback_counted(self) -> None:
+        metrics.reset()
+        infer_timezone("ZZ", "Nowhere")
+        assert metrics.get("boxing_timezone_fallbacks_total") == 1